@@ -2,29 +2,91 @@
 Main application controller for Clipy Windows.
 Coordinates storage, clipboard monitoring, hotkeys, tray, and UI.
 """
+import queue
 import sys
 import threading
+import time
 import tkinter as tk
 
+import keyboard
+import pyperclip
+
 from .storage import Storage
 from .clipboard_monitor import ClipboardMonitor
 from .hotkeys import HotkeyManager
-from .ui.tray import TrayIcon
-from .ui.popup import PopupMenu
+
+
+_ctrl_v_inputs = None   # cached 4-event INPUT array for _send_ctrl_v
+
+
+def _send_ctrl_v() -> bool:
+    """
+    Synthesize Ctrl down, V down, V up, Ctrl up with a single SendInput
+    call — one syscall instead of the keyboard library's parse/hook path.
+    Returns False if SendInput is unavailable or rejected the events.
+    """
+    global _ctrl_v_inputs
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        if _ctrl_v_inputs is None:
+            class KEYBDINPUT(ctypes.Structure):
+                _fields_ = [
+                    ('wVk',         wintypes.WORD),
+                    ('wScan',       wintypes.WORD),
+                    ('dwFlags',     wintypes.DWORD),
+                    ('time',        wintypes.DWORD),
+                    ('dwExtraInfo', ctypes.c_size_t),
+                ]
+
+            class INPUT(ctypes.Structure):
+                class _U(ctypes.Union):
+                    # MOUSEINPUT is the largest union member; pad to cover it.
+                    _fields_ = [('ki', KEYBDINPUT), ('padding', ctypes.c_ubyte * 32)]
+                _anonymous_ = ('u',)
+                _fields_ = [('type', wintypes.DWORD), ('u', _U)]
+
+            INPUT_KEYBOARD = 1
+            KEYEVENTF_KEYUP = 0x0002
+            VK_CONTROL, VK_V = 0x11, 0x56
+
+            events = (INPUT * 4)()
+            for i, (vk, flags) in enumerate([
+                (VK_CONTROL, 0),
+                (VK_V,       0),
+                (VK_V,       KEYEVENTF_KEYUP),
+                (VK_CONTROL, KEYEVENTF_KEYUP),
+            ]):
+                events[i].type = INPUT_KEYBOARD
+                events[i].ki = KEYBDINPUT(wVk=vk, dwFlags=flags)
+            _ctrl_v_inputs = (events, ctypes.sizeof(INPUT))
+
+        events, input_size = _ctrl_v_inputs
+        sent = ctypes.windll.user32.SendInput(4, events, input_size)
+        return sent == 4
+    except Exception:
+        return False
 
 
 class ClipyApp:
     def __init__(self):
         self.storage = Storage()
 
-        # Hidden root window — all Toplevel dialogs are children of this
-        self.root = tk.Tk()
-        self.root.withdraw()
-        self.root.title('Clipy for Windows')
-        self.root.protocol('WM_DELETE_WINDOW', self.quit)
+        # Cross-thread UI dispatch: tkinter is not thread-safe, so hotkey
+        # and tray callbacks enqueue work here; one after() loop on the Tk
+        # thread drains it.
+        self._ui_queue: queue.Queue = queue.Queue()
+
+        # One long-lived paste worker instead of a thread per paste.
+        self._paste_q: queue.Queue = queue.Queue()
+        threading.Thread(target=self._paste_worker, daemon=True, name='PasteWorker').start()
 
-        # Core UI
-        self.popup = PopupMenu(self.root, self.storage, self._paste_content)
+        # UI is built in run(), after the backend services are live; any
+        # hotkey that fires in that window parks in _ui_queue until then.
+        self.root: tk.Tk | None = None
+        self.popup = None
+        self.tray = None
 
         # Backend services
         self.clipboard_monitor = ClipboardMonitor(self.storage)
@@ -35,51 +97,94 @@ class ClipyApp:
             show_snippets_cb=self.show_popup_snippets,
             open_editor_cb=self.open_snippet_editor,
         )
-        self.tray = TrayIcon(self)
 
     # ── Lifecycle ──────────────────────────────────────────────────────────
 
     def run(self):
+        # Start capture and hotkeys first so the app is responsive while
+        # Tk pays its startup cost (font cache init etc.).
         self.clipboard_monitor.start()
         self.hotkey_manager.start()
+
+        # Hidden root window — all Toplevel dialogs are children of this
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.root.title('Clipy for Windows')
+        self.root.protocol('WM_DELETE_WINDOW', self.quit)
+
+        # Core UI — imported here (not at module load) to keep cold start lean
+        from .ui.popup import PopupMenu
+        from .ui.tray import TrayIcon
+        self.popup = PopupMenu(self.root, self.storage, self._paste_content,
+                               visibility_cb=self._on_popup_visibility)
+        self.tray = TrayIcon(self)
+
         threading.Thread(target=self.tray.run, daemon=True, name='TrayIcon').start()
+        self._drain_actions()
         self.root.mainloop()
 
+    def _drain_actions(self):
+        """Run queued UI actions on the Tk thread, then reschedule."""
+        while True:
+            try:
+                action = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                action()
+            except Exception as e:
+                print(f'[Clipy] UI action error: {e}')
+        self.root.after(30, self._drain_actions)
+
     def quit(self):
         self.clipboard_monitor.stop()
         self.hotkey_manager.stop()
         try:
-            self.tray.stop()
+            if self.tray:
+                self.tray.stop()
+        except Exception:
+            pass
+        try:
+            if self.root:
+                self.root.quit()
+                self.root.destroy()
         except Exception:
             pass
+        # Flush anything still sitting in the writer-batch window before
+        # the process dies, or the last few writes are silently lost.
         try:
-            self.root.quit()
-            self.root.destroy()
+            self.storage.close()
         except Exception:
             pass
         sys.exit(0)
 
     # ── Actions (thread-safe via root.after) ──────────────────────────────
 
+    def _on_popup_visibility(self, visible: bool):
+        """Poll fast while the popup is up, slow while dormant (fallback mode only)."""
+        self.clipboard_monitor.set_interval(
+            ClipboardMonitor.POLL_FAST if visible else ClipboardMonitor.POLL_SLOW
+        )
+
     def show_popup(self):
         """Show both history + snippets"""
-        self.root.after(0, lambda: self.popup.show(mode='all'))
+        self._ui_queue.put(lambda: self.popup.show(mode='all'))
 
     def show_popup_history(self):
         """Show history only"""
-        self.root.after(0, lambda: self.popup.show(mode='history'))
+        self._ui_queue.put(lambda: self.popup.show(mode='history'))
 
     def show_popup_snippets(self):
         """Show snippets only"""
-        self.root.after(0, lambda: self.popup.show(mode='snippets'))
+        self._ui_queue.put(lambda: self.popup.show(mode='snippets'))
 
     def open_settings(self):
         from .ui.settings import SettingsDialog
-        self.root.after(0, lambda: SettingsDialog(self.root, self.storage, self.hotkey_manager))
+        self._ui_queue.put(lambda: SettingsDialog(self.root, self.storage, self.hotkey_manager))
 
     def open_snippet_editor(self):
         from .ui.snippet_editor import SnippetEditor
-        self.root.after(0, lambda: SnippetEditor(self.root, self.storage))
+        self._ui_queue.put(lambda: SnippetEditor(self.root, self.storage))
 
     def clear_history(self):
         self.storage.clear_history()
@@ -91,18 +196,21 @@ class ClipyApp:
         After popup closes, copy `content` to clipboard and send Ctrl+V
         to whichever window was previously focused.
         """
-        def _do():
-            import time
-            import pyperclip
-            import keyboard
-
-            # Tell the monitor this is our own copy so it isn't re-recorded
-            self.clipboard_monitor.notify_copied(content)
-            pyperclip.copy(content)
-            time.sleep(0.08)   # Let the popup fully close & focus restore
-            keyboard.send('ctrl+v')
-
-            if source_type == 'snippet' and source_id is not None:
-                self.storage.increment_snippet_usage(source_id)
-
-        threading.Thread(target=_do, daemon=True).start()
+        self._paste_q.put((content, source_id, source_type))
+
+    def _paste_worker(self):
+        while True:
+            content, source_id, source_type = self._paste_q.get()
+            try:
+                # Tell the monitor this is our own copy so it isn't re-recorded
+                self.clipboard_monitor.notify_copied(content)
+                if not self.clipboard_monitor.write_clipboard(content):
+                    pyperclip.copy(content)
+                time.sleep(0.03)   # Let the popup fully close & focus restore
+                if not _send_ctrl_v():
+                    keyboard.send('ctrl+v')
+
+                if source_type == 'snippet' and source_id is not None:
+                    self.storage.increment_snippet_usage(source_id)
+            except Exception as e:
+                print(f'[Clipy] paste error: {e}')
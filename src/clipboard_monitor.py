@@ -1,37 +1,193 @@
 """
 Monitors the Windows clipboard for changes and stores new text clips.
+
+Preferred mode: one hidden message-only window (WinMsgLoop) registered
+via AddClipboardFormatListener receives WM_CLIPBOARDUPDATE and reads the
+clipboard only when it actually changes — zero wake-ups while idle.
+If listener registration fails (very old Windows, missing pywin32),
+falls back to the original polling loop.
 """
 import threading
 import time
 
+WM_CLIPBOARDUPDATE = 0x031D
+
+# Constant-size clip identity: comparing (length, 64-bit hash) instead of
+# the full text keeps change detection O(1) even for multi-MB clipboards.
+try:
+    import xxhash
+
+    def _fingerprint(text: str):
+        return (len(text), xxhash.xxh64_intdigest(text))
+except ImportError:
+    import hashlib
+
+    def _fingerprint(text: str):
+        return (len(text), hashlib.blake2b(
+            text.encode('utf-8', 'surrogatepass'), digest_size=8
+        ).digest())
+
+
+def _open_clipboard_with_retry(timeout_ms: int = 500) -> bool:
+    """
+    Open the clipboard, retrying with exponential backoff while another
+    process holds it. OpenClipboard routinely fails under contention; a
+    single attempt silently drops the clip.
+    """
+    import win32clipboard
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    delay = 0.001
+    while True:
+        try:
+            win32clipboard.OpenClipboard()
+            return True
+        except Exception:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+
+class WinMsgLoop:
+    """
+    A hidden message-only window plus a PumpMessages thread. Subsystems
+    register handlers by message code; the loop thread must stay
+    responsive, so anything that blocks its pump (e.g. the tray's
+    TrackPopupMenu) runs its own window instead.
+    """
+
+    def __init__(self):
+        self._handlers: dict = {}
+        self._hwnd = None
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+        self._ok = False
+
+    @property
+    def hwnd(self):
+        return self._hwnd
+
+    def register(self, msg: int, handler):
+        """Handle a window message; handler is called as handler(wparam, lparam)."""
+        self._handlers[msg] = handler
+
+    def start(self) -> bool:
+        """Spawn the loop thread; returns False if the window could not be made."""
+        self._thread = threading.Thread(target=self._run, daemon=True, name='WinMsgLoop')
+        self._thread.start()
+        self._started.wait(timeout=5.0)
+        return self._ok
+
+    def stop(self):
+        if self._hwnd:
+            try:
+                import win32con
+                import win32gui
+                win32gui.PostMessage(self._hwnd, win32con.WM_CLOSE, 0, 0)
+            except Exception:
+                pass
+
+    def _run(self):
+        try:
+            import win32con
+            import win32gui
+
+            def wndproc(hwnd, msg, wparam, lparam):
+                handler = self._handlers.get(msg)
+                if handler is not None:
+                    try:
+                        handler(wparam, lparam)
+                    except Exception:
+                        pass
+                    return 0
+                if msg == win32con.WM_DESTROY:
+                    win32gui.PostQuitMessage(0)
+                    return 0
+                return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+            wc = win32gui.WNDCLASS()
+            wc.lpfnWndProc = wndproc
+            wc.lpszClassName = 'ClipyMsgLoop'
+            wc.hInstance = win32gui.GetModuleHandle(None)
+            atom = win32gui.RegisterClass(wc)
+
+            HWND_MESSAGE = -3  # message-only window: no paint, no z-order, no broadcast
+            self._hwnd = win32gui.CreateWindowEx(
+                0, atom, None, 0, 0, 0, 0, 0, HWND_MESSAGE, 0, wc.hInstance, None
+            )
+            self._ok = True
+        except Exception:
+            self._ok = False
+        finally:
+            self._started.set()
+
+        if not self._ok:
+            return
+        try:
+            win32gui.PumpMessages()
+        finally:
+            self._hwnd = None
+
 
 class ClipboardMonitor:
-    INTERVAL = 0.4  # seconds between polls
+    INTERVAL = 0.4       # seconds between polls (fallback mode)
+    POLL_FAST = 0.2      # while the popup is visible
+    POLL_SLOW = 2.0      # while Clipy is dormant in the background
 
     def __init__(self, storage):
         self.storage = storage
+        self.msg_loop: WinMsgLoop | None = None
         self._thread: threading.Thread | None = None
         self._running = False
-        self._last = ''
+        self._last_fp = _fingerprint('')
+        self._listener_hwnd = None
+        self._interval = self.INTERVAL
+        self._wake = threading.Event()
+        self._last_seq = 0
+        self._win32 = None   # win32clipboard module, imported once in start()
 
     def start(self):
+        try:
+            import win32clipboard
+            self._win32 = win32clipboard
+        except ImportError:
+            self._win32 = None
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True, name='ClipboardMonitor')
-        self._thread.start()
+        try:
+            self._last_fp = _fingerprint(self._read_clipboard())
+        except Exception:
+            self._last_fp = _fingerprint('')
+
+        if not self._start_listener():
+            # Listener unavailable — fall back to polling.
+            self._thread = threading.Thread(
+                target=self._run_poll, daemon=True, name='ClipboardMonitor'
+            )
+            self._thread.start()
 
     def stop(self):
         self._running = False
+        self._wake.set()   # wake the poll loop so shutdown is immediate
+        if self._listener_hwnd:
+            try:
+                import ctypes
+                ctypes.windll.user32.RemoveClipboardFormatListener(self._listener_hwnd)
+            except Exception:
+                pass
+            self._listener_hwnd = None
+        if self.msg_loop:
+            self.msg_loop.stop()
 
     def _read_clipboard(self) -> str:
         """Read text from clipboard using win32 API for reliability."""
+        w32 = self._win32
         try:
-            import win32clipboard
-            win32clipboard.OpenClipboard()
-            try:
-                if win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
-                    return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
-            finally:
-                win32clipboard.CloseClipboard()
+            if w32 is not None and _open_clipboard_with_retry():
+                try:
+                    if w32.IsClipboardFormatAvailable(w32.CF_UNICODETEXT):
+                        return w32.GetClipboardData(w32.CF_UNICODETEXT)
+                finally:
+                    w32.CloseClipboard()
         except Exception:
             pass
         # Fallback to pyperclip
@@ -41,22 +197,85 @@ class ClipboardMonitor:
         except Exception:
             return ''
 
-    def _run(self):
+    # ── Event-driven listener ─────────────────────────────────────────────
+
+    def _start_listener(self) -> bool:
+        """Register WM_CLIPBOARDUPDATE on the shared message loop."""
         try:
-            self._last = self._read_clipboard()
+            import ctypes
+            self.msg_loop = WinMsgLoop()
+            self.msg_loop.register(
+                WM_CLIPBOARDUPDATE, lambda wparam, lparam: self._on_clipboard_update()
+            )
+            if not self.msg_loop.start():
+                return False
+            if not ctypes.windll.user32.AddClipboardFormatListener(self.msg_loop.hwnd):
+                self.msg_loop.stop()
+                return False
+            self._listener_hwnd = self.msg_loop.hwnd
+            return True
         except Exception:
-            self._last = ''
+            return False
 
-        while self._running:
-            try:
-                current = self._read_clipboard()
-                if current and current != self._last:
-                    self._last = current
+    def _on_clipboard_update(self):
+        try:
+            current = self._read_clipboard()
+            if current:
+                fp = _fingerprint(current)
+                if fp != self._last_fp:
+                    self._last_fp = fp
                     self.storage.add_clip(current)
-            except Exception:
-                pass
-            time.sleep(self.INTERVAL)
+        except Exception:
+            pass
+
+    # ── Polling fallback ──────────────────────────────────────────────────
+
+    def _run_poll(self):
+        # GetClipboardSequenceNumber is a single cheap call that bumps on
+        # every clipboard change, so idle iterations skip the whole
+        # Open/Get/Close round-trip (and the text copy it allocates).
+        try:
+            import ctypes
+            get_seq = ctypes.windll.user32.GetClipboardSequenceNumber
+        except Exception:
+            get_seq = None
+
+        while self._running:
+            if self._wake.wait(self._interval):
+                self._wake.clear()
+            if not self._running:
+                break
+            changed = True
+            if get_seq is not None:
+                seq = get_seq()
+                changed = seq != self._last_seq
+                self._last_seq = seq
+            if changed:
+                self._on_clipboard_update()
+
+    def set_interval(self, seconds: float):
+        """Adjust the fallback poll cadence; takes effect immediately."""
+        self._interval = seconds
+        self._wake.set()
 
     def notify_copied(self, text: str):
         """Call this when Clipy itself copies to clipboard so we can skip it."""
-        self._last = text
+        self._last_fp = _fingerprint(text)
+
+    def write_clipboard(self, text: str) -> bool:
+        """Write text to the clipboard directly via win32 (no pyperclip
+        round-trip); returns False so callers can fall back."""
+        w32 = self._win32
+        if w32 is None:
+            return False
+        try:
+            if not _open_clipboard_with_retry():
+                return False
+            try:
+                w32.EmptyClipboard()
+                w32.SetClipboardData(w32.CF_UNICODETEXT, text)
+            finally:
+                w32.CloseClipboard()
+            return True
+        except Exception:
+            return False
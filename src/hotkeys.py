@@ -19,6 +19,14 @@ class HotkeyManager:
         self._cb_editor   = open_editor_cb
         self._ids: list = []
         self._running = False
+        # Static (setting key, default, callback) table, built once.
+        self._pairs = [
+            ('hotkey_main',     'ctrl+shift+v', self._cb_all),
+            ('hotkey_history',  'ctrl+shift+h', self._cb_history),
+            ('hotkey_snippets', 'ctrl+shift+s', self._cb_snippets),
+            ('hotkey_editor',   'ctrl+shift+e', self._cb_editor),
+        ]
+        self._current: dict = {}   # key → hotkey string actually registered
 
     def start(self):
         self._running = True
@@ -35,17 +43,18 @@ class HotkeyManager:
     # ── Internal ──────────────────────────────────────────────────────────
 
     def _register(self):
-        self._unregister()
         import keyboard
 
-        pairs = [
-            ('hotkey_main',     'ctrl+shift+v', self._cb_all),
-            ('hotkey_history',  'ctrl+shift+h', self._cb_history),
-            ('hotkey_snippets', 'ctrl+shift+s', self._cb_snippets),
-            ('hotkey_editor',   'ctrl+shift+e', self._cb_editor),
-        ]
-        for key, default, cb in pairs:
-            hk = self.storage.get_setting(key, default).strip()
+        desired = {
+            key: self.storage.get_setting(key, default).strip()
+            for key, default, _ in self._pairs
+        }
+        if desired == self._current and self._ids:
+            return   # bindings unchanged — skip the hook rewiring entirely
+
+        self._unregister()
+        for key, default, cb in self._pairs:
+            hk = desired[key]
             if not hk:
                 continue
             try:
@@ -53,15 +62,22 @@ class HotkeyManager:
                 self._ids.append(hid)
             except Exception as e:
                 print(f'[Clipy] Failed to register hotkey "{hk}" ({key}): {e}')
+        self._current = desired
 
     def _unregister(self):
         import keyboard
-        for hid in self._ids:
+        if self._ids:
             try:
-                keyboard.remove_hotkey(hid)
+                # One bulk removal instead of per-hotkey hook-list walks.
+                keyboard.remove_all_hotkeys()
             except Exception:
-                pass
+                for hid in self._ids:
+                    try:
+                        keyboard.remove_hotkey(hid)
+                    except Exception:
+                        pass
         self._ids.clear()
+        self._current = {}
 
     # ── Accessors ─────────────────────────────────────────────────────────
 
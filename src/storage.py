@@ -2,13 +2,67 @@
 Storage layer for Clipy Windows.
 Uses SQLite to persist clipboard history, snippets, and settings.
 """
+import hashlib
+import io
 import sqlite3
 import os
+import queue
+import sys
+import threading
+import time
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+# Clips larger than this are stored truncated, with a hash of the full
+# payload kept for dedup; bounds DB size and popup rendering cost.
+MAX_CLIP_CHARS = 1_000_000
+
+
+def _hash64(text: str) -> str:
+    return hashlib.blake2b(
+        text.encode('utf-8', 'surrogatepass'), digest_size=8
+    ).hexdigest()
+
+
+# Hot-path SQL kept as module constants: the same string object is passed
+# to execute() every call, so it always hits sqlite3's statement cache.
+_SQL_INSERT_CLIP = '''INSERT INTO clips (content) VALUES (?)
+               ON CONFLICT(content) DO UPDATE SET
+                   created_at=CURRENT_TIMESTAMP, times_used=times_used+1'''
+_SQL_GET_CLIPS = 'SELECT * FROM clips ORDER BY created_at DESC, id DESC LIMIT ?'
+_SQL_SEARCH_CLIPS = 'SELECT * FROM clips WHERE content LIKE ? ORDER BY created_at DESC, id DESC LIMIT ?'
+_SQL_BUMP_SNIPPET = 'UPDATE snippets SET times_used=times_used+1 WHERE id=?'
+_SQL_SNIPPETS_BY_FOLDER = 'SELECT * FROM snippets WHERE folder_id=? ORDER BY times_used DESC, title'
+_SQL_SEARCH_CLIPS_FTS = '''SELECT c.* FROM clips c JOIN clips_fts f ON f.rowid = c.id
+    WHERE clips_fts MATCH ? ORDER BY c.created_at DESC, c.id DESC LIMIT ?'''
+_SQL_SEARCH_SNIPPETS_FTS = '''SELECT s.* FROM snippets s JOIN snippets_fts f ON f.rowid = s.id
+    WHERE snippets_fts MATCH ? ORDER BY s.title'''
+
+# List-view variants: only a display-ready preview of content leaves the
+# row store (newlines flattened, truncation flagged), so rendering the
+# popup never materializes megabyte clips nor re-slices them in Python.
+PREVIEW_CHARS = 75
+
+
+def _preview_cols(col: str) -> str:
+    return (f"trim(replace(replace(substr({col}, 1, {PREVIEW_CHARS}),"
+            f" char(10), ' '), char(13), ' ')) AS preview,"
+            f" length({col}) > {PREVIEW_CHARS} AS trunc")
+
+
+_SQL_GET_CLIP_PREVIEWS = f'''SELECT id, {_preview_cols("content")}, created_at
+    FROM clips ORDER BY created_at DESC, id DESC LIMIT ?'''
+_SQL_SEARCH_CLIP_PREVIEWS = f'''SELECT id, {_preview_cols("content")}, created_at
+    FROM clips WHERE content LIKE ? ORDER BY created_at DESC, id DESC LIMIT ?'''
+_SQL_SEARCH_CLIP_PREVIEWS_FTS = f'''SELECT c.id, {_preview_cols("c.content")},
+    c.created_at FROM clips c JOIN clips_fts f ON f.rowid = c.id
+    WHERE clips_fts MATCH ? ORDER BY c.created_at DESC, c.id DESC LIMIT ?'''
 
 
 class Storage:
@@ -16,11 +70,46 @@ class Storage:
         app_dir = Path(os.environ.get('APPDATA', os.path.expanduser('~'))) / 'Clipy'
         app_dir.mkdir(exist_ok=True)
         self.db_path = app_dir / 'clipy.db'
-        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                     cached_statements=256)
         self._conn.row_factory = sqlite3.Row
+        self._tune_pragmas()
         self._create_tables()
+        self._create_fts()
         self._init_default_settings()
 
+        # Settings are tiny and read on every poll/hotkey/popup — keep
+        # them in a dict and write through on set_setting.
+        self._settings = {
+            row['key']: row['value']
+            for row in self._conn.execute('SELECT key, value FROM settings')
+        }
+
+        # Cached hot values so the clip path avoids per-insert SQL.
+        self._max_hist = int(self.get_setting('max_history', '100'))
+        self._clip_count = self._conn.execute('SELECT COUNT(*) FROM clips').fetchone()[0]
+
+        # Fire-and-forget writes (clip inserts from the monitor thread,
+        # usage bumps from the paste worker, setting writes) go through a
+        # single-writer queue so callers never block on a commit fsync.
+        self._writeq: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain, daemon=True, name='StorageWriter')
+        self._writer.start()
+
+    def _tune_pragmas(self):
+        """WAL + relaxed sync: commits become append-only writes with a
+        single fsync, and readers never block the writer thread."""
+        try:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA temp_store=MEMORY')
+            self._conn.execute('PRAGMA cache_size=-8000')
+            self._conn.execute('PRAGMA mmap_size=67108864')
+            self._conn.execute('PRAGMA wal_autocheckpoint=1000')
+            self._conn.execute('PRAGMA busy_timeout=2000')
+        except sqlite3.Error as e:
+            print(f'[Clipy] pragma setup error: {e}')
+
     def _create_tables(self):
         self._conn.executescript('''
             CREATE TABLE IF NOT EXISTS clips (
@@ -51,9 +140,110 @@ class Storage:
                 key   TEXT PRIMARY KEY,
                 value TEXT
             );
+
+            CREATE INDEX IF NOT EXISTS idx_clips_created ON clips(created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_snippets_folder_title
+                ON snippets(folder_id, title);
+            CREATE INDEX IF NOT EXISTS idx_snippets_folder_used
+                ON snippets(folder_id, times_used DESC, title);
+            CREATE INDEX IF NOT EXISTS idx_folders_parent_sort
+                ON folders(parent_id, sort_order, name);
+            -- anchored LIKE patterns can range-scan this NOCASE index
+            CREATE INDEX IF NOT EXISTS idx_clips_content_nocase
+                ON clips(content COLLATE NOCASE);
         ''')
+        try:
+            self._conn.execute(
+                'CREATE UNIQUE INDEX IF NOT EXISTS idx_clips_content ON clips(content)'
+            )
+        except sqlite3.IntegrityError:
+            # Pre-existing DB with duplicate rows: keep the newest of each
+            # content, then the unique index can be built.
+            self._conn.execute(
+                'DELETE FROM clips WHERE id NOT IN (SELECT MAX(id) FROM clips GROUP BY content)'
+            )
+            self._conn.execute(
+                'CREATE UNIQUE INDEX IF NOT EXISTS idx_clips_content ON clips(content)'
+            )
+        cols = {row[1] for row in self._conn.execute('PRAGMA table_info(clips)')}
+        if 'truncated_hash' not in cols:
+            self._conn.execute('ALTER TABLE clips ADD COLUMN truncated_hash TEXT')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_clips_hash ON clips(truncated_hash) '
+            'WHERE truncated_hash IS NOT NULL'
+        )
         self._conn.commit()
 
+    def _create_fts(self):
+        """
+        Trigram FTS5 companion tables for substring search, maintained by
+        triggers. Falls back to LIKE scans when the build of SQLite lacks
+        FTS5/trigram support.
+        """
+        try:
+            self._conn.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS clips_fts USING fts5(
+                    content, content='clips', content_rowid='id', tokenize='trigram');
+                CREATE TRIGGER IF NOT EXISTS clips_fts_ai AFTER INSERT ON clips BEGIN
+                    INSERT INTO clips_fts(rowid, content) VALUES (new.id, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS clips_fts_ad AFTER DELETE ON clips BEGIN
+                    INSERT INTO clips_fts(clips_fts, rowid, content)
+                        VALUES ('delete', old.id, old.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS clips_fts_au AFTER UPDATE OF content ON clips BEGIN
+                    INSERT INTO clips_fts(clips_fts, rowid, content)
+                        VALUES ('delete', old.id, old.content);
+                    INSERT INTO clips_fts(rowid, content) VALUES (new.id, new.content);
+                END;
+
+                CREATE VIRTUAL TABLE IF NOT EXISTS snippets_fts USING fts5(
+                    title, content, content='snippets', content_rowid='id', tokenize='trigram');
+                CREATE TRIGGER IF NOT EXISTS snippets_fts_ai AFTER INSERT ON snippets BEGIN
+                    INSERT INTO snippets_fts(rowid, title, content)
+                        VALUES (new.id, new.title, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS snippets_fts_ad AFTER DELETE ON snippets BEGIN
+                    INSERT INTO snippets_fts(snippets_fts, rowid, title, content)
+                        VALUES ('delete', old.id, old.title, old.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS snippets_fts_au AFTER UPDATE ON snippets BEGIN
+                    INSERT INTO snippets_fts(snippets_fts, rowid, title, content)
+                        VALUES ('delete', old.id, old.title, old.content);
+                    INSERT INTO snippets_fts(rowid, title, content)
+                        VALUES (new.id, new.title, new.content);
+                END;
+            ''')
+            # Rebuild if the index drifted (e.g. DB predates the FTS tables).
+            for table, fts in (('clips', 'clips_fts'), ('snippets', 'snippets_fts')):
+                n = self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                n_fts = self._conn.execute(f'SELECT COUNT(*) FROM {fts}').fetchone()[0]
+                if n != n_fts:
+                    self._conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+            self._conn.commit()
+            self._fts = True
+        except sqlite3.OperationalError:
+            self._fts = False
+
+    @staticmethod
+    def _fts_query(search: str) -> str:
+        """Quote a raw search string as a single FTS5 phrase."""
+        return '"' + search.replace('"', '""') + '"'
+
+    @staticmethod
+    def _like_pattern(search: str) -> str:
+        """
+        Build the LIKE pattern for a user query. Queries containing an
+        explicit '%' pass through untouched — an anchored pattern like
+        'foo%' can then range-scan the NOCASE index instead of forcing
+        the '%q%' full scan. A bare '_' is far more likely to be part of
+        an identifier than a deliberate single-char wildcard, so it gets
+        wrapped like any other literal.
+        """
+        if '%' in search:
+            return search
+        return f'%{search}%'
+
     def _init_default_settings(self):
         defaults = {
             'max_history': '100',
@@ -63,81 +253,202 @@ class Storage:
             'start_with_windows': 'false',
             'theme': 'dark',
         }
-        cur = self._conn.cursor()
-        for key, value in defaults.items():
-            cur.execute('INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)', (key, value))
-        self._conn.commit()
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)',
+                list(defaults.items()),
+            )
 
     # ── Settings ──────────────────────────────────────────────────────────
 
     def get_setting(self, key, default=None):
-        row = self._conn.execute('SELECT value FROM settings WHERE key=?', (key,)).fetchone()
-        return row['value'] if row else default
+        return self._settings.get(key, default)
 
     def set_setting(self, key, value):
-        self._conn.execute('INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)', (key, str(value)))
-        self._conn.commit()
+        self._settings[key] = str(value)
+        if key == 'max_history':
+            self._max_hist = int(value)
+        self._writeq.put((
+            'exec',
+            'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
+            (key, str(value)),
+        ))
 
     # ── Windows startup ───────────────────────────────────────────────────
 
+    _RUN_KEY = r'Software\Microsoft\Windows\CurrentVersion\Run'
+    _EXE_VALUE = f'"{sys.executable}"'
+
     def apply_startup(self, enabled: bool):
         """Add or remove Clipy from HKCU Run registry key."""
-        import winreg, sys
-        key_path = r'Software\Microsoft\Windows\CurrentVersion\Run'
+        if winreg is None:
+            return
         try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE)
-            if enabled:
-                exe = sys.executable
-                winreg.SetValueEx(key, 'Clipy', 0, winreg.REG_SZ, f'"{exe}"')
-            else:
-                try:
-                    winreg.DeleteValue(key, 'Clipy')
-                except FileNotFoundError:
-                    pass
-            winreg.CloseKey(key)
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self._RUN_KEY, 0,
+                                winreg.KEY_SET_VALUE) as key:
+                if enabled:
+                    winreg.SetValueEx(key, 'Clipy', 0, winreg.REG_SZ, self._EXE_VALUE)
+                else:
+                    try:
+                        winreg.DeleteValue(key, 'Clipy')
+                    except FileNotFoundError:
+                        pass
         except Exception as e:
             print(f'[Clipy] startup registry error: {e}')
 
     # ── Clipboard history ─────────────────────────────────────────────────
 
     def add_clip(self, content: str):
+        """Queue a clip for insertion; returns immediately."""
         if not content or not content.strip():
             return
+        full_hash = None
+        if len(content) > MAX_CLIP_CHARS:
+            # Hash the full payload before truncating so two huge clips
+            # with the same prefix still dedup correctly.
+            full_hash = f'{len(content)}:{_hash64(content)}'
+            content = content[:MAX_CLIP_CHARS]
+        self._writeq.put(('clip', content, full_hash))
+
+    BATCH_WINDOW = 0.25  # seconds to coalesce a burst of copies into one commit
+
+    def _drain(self):
+        """Writer thread: coalesce queued writes into one transaction."""
+        closing = False
+        while not closing:
+            item = self._writeq.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = self._writeq.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    closing = True
+                    break
+                batch.append(nxt)
+            try:
+                self._apply_writes(batch)
+            except Exception as e:
+                print(f'[Clipy] queued write error: {e}')
+
+    def _apply_writes(self, batch: list):
+        # Single upsert per clip (the unique index on content turns the old
+        # SELECT-then-UPDATE/INSERT into one O(log N) index probe), with one
+        # commit covering the whole burst.
         cur = self._conn.cursor()
-        existing = cur.execute('SELECT id FROM clips WHERE content=?', (content,)).fetchone()
-        if existing:
-            cur.execute(
-                'UPDATE clips SET created_at=CURRENT_TIMESTAMP, times_used=times_used+1 WHERE id=?',
-                (existing['id'],),
-            )
-        else:
-            cur.execute('INSERT INTO clips (content) VALUES (?)', (content,))
-            max_hist = int(self.get_setting('max_history', '100'))
-            cur.execute(
-                'DELETE FROM clips WHERE id NOT IN (SELECT id FROM clips ORDER BY created_at DESC LIMIT ?)',
-                (max_hist,),
-            )
+        n_clips = 0
+        for item in batch:
+            if item[0] == 'exec':
+                cur.execute(item[1], item[2])
+                continue
+            _, content, full_hash = item
+            n_clips += 1
+            if full_hash:
+                # Truncated clip: dedup on the full-payload hash, not the
+                # (shared-prefix-prone) stored text.
+                row = cur.execute(
+                    'SELECT id FROM clips WHERE truncated_hash=?', (full_hash,)
+                ).fetchone()
+                if row:
+                    cur.execute(
+                        'UPDATE clips SET created_at=CURRENT_TIMESTAMP, '
+                        'times_used=times_used+1 WHERE id=?',
+                        (row['id'],),
+                    )
+                else:
+                    cur.execute(
+                        'INSERT OR IGNORE INTO clips (content, truncated_hash) VALUES (?, ?)',
+                        (content, full_hash),
+                    )
+                    if cur.rowcount == 0:
+                        # Another huge clip shares this prefix; make the
+                        # stored text unique with a visible truncation marker.
+                        cur.execute(
+                            'INSERT OR IGNORE INTO clips (content, truncated_hash) VALUES (?, ?)',
+                            (f'{content}\n…[truncated {full_hash}]', full_hash),
+                        )
+            else:
+                cur.execute(_SQL_INSERT_CLIP, (content,))
+        # Prune lazily: the cached count overestimates when a clip dedupes
+        # into an update, which only makes the real COUNT run a bit sooner.
+        self._clip_count += n_clips
+        if self._clip_count > self._max_hist * 1.25:
+            # Find the N-th newest row via the created_at index, then delete
+            # older rows with a bounded range scan — no full-table sort and
+            # no materialized NOT IN set. created_at is second-granularity,
+            # so id breaks ties: a burst of same-second inserts would
+            # otherwise never fall below the cutoff and never be pruned.
+            cutoff = cur.execute(
+                'SELECT created_at, id FROM clips '
+                'ORDER BY created_at DESC, id DESC LIMIT 1 OFFSET ?',
+                (self._max_hist - 1,),
+            ).fetchone()
+            if cutoff:
+                cur.execute(
+                    'DELETE FROM clips WHERE created_at < ? '
+                    'OR (created_at = ? AND id < ?)',
+                    (cutoff[0], cutoff[0], cutoff[1]),
+                )
+            self._clip_count = cur.execute('SELECT COUNT(*) FROM clips').fetchone()[0]
         self._conn.commit()
 
     def get_clips(self, limit: int = 0, search: str = None):
         max_hist = int(self.get_setting('max_history', '100'))
         n = limit or max_hist
+        search = search.strip() if search else None
+        if search:
+            # Trigram FTS needs >= 3 chars; shorter queries use the LIKE scan.
+            if self._fts and len(search) >= 3 and '%' not in search:
+                try:
+                    return self._conn.execute(
+                        _SQL_SEARCH_CLIPS_FTS, (self._fts_query(search), n)
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    pass
+            return self._conn.execute(_SQL_SEARCH_CLIPS, (self._like_pattern(search), n)).fetchall()
+        return self._conn.execute(_SQL_GET_CLIPS, (n,)).fetchall()
+
+    def get_clip_previews(self, limit: int = 0, search: str = None):
+        """Like get_clips, but rows carry only id, a short preview, and
+        created_at — for list rendering."""
+        n = limit or self._max_hist
+        search = search.strip() if search else None
         if search:
+            if self._fts and len(search) >= 3 and '%' not in search:
+                try:
+                    return self._conn.execute(
+                        _SQL_SEARCH_CLIP_PREVIEWS_FTS, (self._fts_query(search), n)
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    pass
             return self._conn.execute(
-                'SELECT * FROM clips WHERE content LIKE ? ORDER BY created_at DESC LIMIT ?',
-                (f'%{search}%', n),
+                _SQL_SEARCH_CLIP_PREVIEWS, (self._like_pattern(search), n)
             ).fetchall()
-        return self._conn.execute(
-            'SELECT * FROM clips ORDER BY created_at DESC LIMIT ?', (n,)
-        ).fetchall()
+        return self._conn.execute(_SQL_GET_CLIP_PREVIEWS, (n,)).fetchall()
+
+    def get_clip_content(self, clip_id: int) -> str:
+        """Full content of one clip, fetched only when actually pasted."""
+        row = self._conn.execute(
+            'SELECT content FROM clips WHERE id=?', (clip_id,)
+        ).fetchone()
+        return row['content'] if row else ''
 
     def delete_clip(self, clip_id: int):
         self._conn.execute('DELETE FROM clips WHERE id=?', (clip_id,))
         self._conn.commit()
+        self._clip_count = max(0, self._clip_count - 1)
 
     def clear_history(self):
         self._conn.execute('DELETE FROM clips')
         self._conn.commit()
+        self._clip_count = 0
 
     # ── Folders ───────────────────────────────────────────────────────────
 
@@ -161,6 +472,18 @@ class Storage:
             ORDER BY total_used DESC, f.name
         ''').fetchall()
 
+    def get_folders_with_snippets(self):
+        """Root folders that contain at least one snippet, usage-sorted —
+        one query instead of a per-folder emptiness probe."""
+        return self._conn.execute('''
+            SELECT f.id, f.name, COALESCE(SUM(s.times_used), 0) AS total_used
+            FROM folders f
+            JOIN snippets s ON s.folder_id = f.id
+            WHERE f.parent_id IS NULL
+            GROUP BY f.id
+            ORDER BY total_used DESC, f.name
+        ''').fetchall()
+
     def add_folder(self, name: str, parent_id=None) -> int:
         cur = self._conn.execute('INSERT INTO folders (name, parent_id) VALUES (?, ?)', (name, parent_id))
         self._conn.commit()
@@ -171,27 +494,90 @@ class Storage:
         self._conn.commit()
 
     def delete_folder(self, folder_id: int):
-        self._conn.execute('DELETE FROM snippets WHERE folder_id=?', (folder_id,))
-        self._conn.execute('DELETE FROM folders WHERE parent_id=?', (folder_id,))
-        self._conn.execute('DELETE FROM folders WHERE id=?', (folder_id,))
-        self._conn.commit()
+        # Collect the whole subtree with a recursive CTE so nested
+        # sub-folders (and their snippets) go too, atomically.
+        with self._conn:
+            ids = [row[0] for row in self._conn.execute(
+                '''WITH RECURSIVE sub(id) AS (
+                       VALUES(?)
+                       UNION ALL
+                       SELECT f.id FROM folders f JOIN sub ON f.parent_id = sub.id
+                   ) SELECT id FROM sub''',
+                (folder_id,),
+            )]
+            qmarks = ','.join('?' * len(ids))
+            self._conn.execute(f'DELETE FROM snippets WHERE folder_id IN ({qmarks})', ids)
+            self._conn.execute(f'DELETE FROM folders WHERE id IN ({qmarks})', ids)
 
     # ── Snippets ──────────────────────────────────────────────────────────
 
     def get_snippets(self, folder_id=None, search: str = None):
+        search = search.strip() if search else None
         if search:
+            if self._fts and len(search) >= 3 and '%' not in search:
+                try:
+                    return self._conn.execute(
+                        _SQL_SEARCH_SNIPPETS_FTS, (self._fts_query(search),)
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    pass
+            pattern = self._like_pattern(search)
             return self._conn.execute(
                 'SELECT * FROM snippets WHERE title LIKE ? OR content LIKE ? ORDER BY title',
-                (f'%{search}%', f'%{search}%'),
+                (pattern, pattern),
+            ).fetchall()
+        if folder_id is not None:
+            return self._conn.execute(_SQL_SNIPPETS_BY_FOLDER, (folder_id,)).fetchall()
+        return self._conn.execute(
+            'SELECT * FROM snippets WHERE folder_id IS NULL ORDER BY title'
+        ).fetchall()
+
+    def get_snippet_titles(self, folder_id=None, search: str = None):
+        """Like get_snippets but only id/title leave the row store — the
+        popup renders titles and fetches content on paste."""
+        search = search.strip() if search else None
+        if search:
+            if self._fts and len(search) >= 3 and '%' not in search:
+                try:
+                    return self._conn.execute(
+                        '''SELECT s.id, s.title FROM snippets s
+                           JOIN snippets_fts f ON f.rowid = s.id
+                           WHERE snippets_fts MATCH ? ORDER BY s.title''',
+                        (self._fts_query(search),),
+                    ).fetchall()
+                except sqlite3.OperationalError:
+                    pass
+            pattern = self._like_pattern(search)
+            return self._conn.execute(
+                'SELECT id, title FROM snippets WHERE title LIKE ? OR content LIKE ? ORDER BY title',
+                (pattern, pattern),
             ).fetchall()
         if folder_id is not None:
             return self._conn.execute(
-                'SELECT * FROM snippets WHERE folder_id=? ORDER BY times_used DESC, title', (folder_id,)
+                'SELECT id, title FROM snippets WHERE folder_id=? ORDER BY times_used DESC, title',
+                (folder_id,),
             ).fetchall()
         return self._conn.execute(
-            'SELECT * FROM snippets WHERE folder_id IS NULL ORDER BY title'
+            'SELECT id, title FROM snippets WHERE folder_id IS NULL ORDER BY title'
         ).fetchall()
 
+    _SQL_GET_SNIPPET = 'SELECT title, content, folder_id FROM snippets WHERE id=?'
+
+    def get_snippet(self, snippet_id: int):
+        """One snippet row (title, content, folder_id), or None.
+
+        The constant SQL text hits the connection's statement cache, so
+        repeated lookups skip the parse step.
+        """
+        return self._conn.execute(self._SQL_GET_SNIPPET, (snippet_id,)).fetchone()
+
+    def get_snippet_content(self, snippet_id: int) -> str:
+        """Full content of one snippet, fetched only when actually used."""
+        row = self._conn.execute(
+            'SELECT content FROM snippets WHERE id=?', (snippet_id,)
+        ).fetchone()
+        return row['content'] if row else ''
+
     def get_all_snippets(self):
         return self._conn.execute('SELECT * FROM snippets ORDER BY title').fetchall()
 
@@ -215,16 +601,22 @@ class Storage:
         self._conn.commit()
 
     def increment_snippet_usage(self, snippet_id: int):
-        self._conn.execute(
-            'UPDATE snippets SET times_used=times_used+1 WHERE id=?', (snippet_id,)
-        )
-        self._conn.commit()
+        self._writeq.put(('exec', _SQL_BUMP_SNIPPET, (snippet_id,)))
 
     def reset_usage_counts(self):
         self._conn.execute('UPDATE snippets SET times_used=0')
         self._conn.commit()
 
     def close(self):
+        self._writeq.put(None)
+        self._writer.join(timeout=1.0)
+        try:
+            # Refresh planner statistics, then fold the WAL back into the
+            # main DB so the -wal file stays small.
+            self._conn.execute('PRAGMA optimize')
+            self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except sqlite3.Error:
+            pass
         self._conn.close()
 
     # ── Import / Export (XML format compatible with Clipy macOS) ────────
@@ -234,66 +626,50 @@ class Storage:
         Export all snippets and folders to XML format.
         Compatible with Clipy for macOS.
         """
-        root = ET.Element('folders')
-        
-        # Export folders with their snippets
+        buf = io.StringIO()
+        self.export_snippets_xml_to(buf)
+        return buf.getvalue()
+
+    def export_snippets_xml_to(self, fp):
+        """
+        Stream the XML export to an open text file object, one folder
+        element at a time — peak memory stays at the largest folder
+        instead of the whole serialized document.
+        """
+        # One query for every snippet, grouped by folder in Python —
+        # avoids a SELECT per folder (N+1).
+        by_folder: dict = {}
+        for snippet in self._conn.execute(
+            'SELECT folder_id, title, content FROM snippets ORDER BY title'
+        ):
+            by_folder.setdefault(snippet['folder_id'], []).append(snippet)
+
+        fp.write('<?xml version="1.0" encoding="utf-8" standalone="no"?>\n')
+        fp.write('<folders>\n')
         for folder in self._conn.execute('SELECT * FROM folders ORDER BY sort_order, name').fetchall():
-            folder_elem = ET.SubElement(root, 'folder')
-            
-            # Folder title
-            title_elem = ET.SubElement(folder_elem, 'title')
-            title_elem.text = folder['name']
-            
-            # Folder snippets
-            snippets_elem = ET.SubElement(folder_elem, 'snippets')
-            
-            folder_snippets = self._conn.execute(
-                'SELECT * FROM snippets WHERE folder_id=? ORDER BY title', (folder['id'],)
-            ).fetchall()
-            
-            for snippet in folder_snippets:
-                snippet_elem = ET.SubElement(snippets_elem, 'snippet')
-                snippet_title = ET.SubElement(snippet_elem, 'title')
-                snippet_title.text = snippet['title']
-                snippet_content = ET.SubElement(snippet_elem, 'content')
-                snippet_content.text = snippet['content']
-        
+            self._write_folder_xml(fp, folder['name'], by_folder.get(folder['id'], []))
         # Export root-level snippets as a special folder
-        root_snippets = self._conn.execute(
-            'SELECT * FROM snippets WHERE folder_id IS NULL ORDER BY title'
-        ).fetchall()
-        
+        root_snippets = by_folder.get(None, [])
         if root_snippets:
-            root_folder = ET.SubElement(root, 'folder')
-            root_title = ET.SubElement(root_folder, 'title')
-            root_title.text = 'Root Snippets'
-            root_snippets_elem = ET.SubElement(root_folder, 'snippets')
-            
-            for snippet in root_snippets:
-                snippet_elem = ET.SubElement(root_snippets_elem, 'snippet')
-                snippet_title = ET.SubElement(snippet_elem, 'title')
-                snippet_title.text = snippet['title']
-                snippet_content = ET.SubElement(snippet_elem, 'content')
-                snippet_content.text = snippet['content']
-        
-        # Generate XML string with proper formatting
-        xml_str = ET.tostring(root, encoding='unicode')
-        return self._format_xml(xml_str)
-
-    def _format_xml(self, xml_str: str) -> str:
-        """Format XML with proper indentation for readability."""
-        try:
-            import xml.dom.minidom
-            dom = xml.dom.minidom.parseString(xml_str)
-            # Remove extra blank lines
-            pretty_xml = dom.toprettyxml(indent='  ', encoding='utf-8').decode('utf-8')
-            # Add XML declaration matching Clipy format
-            lines = [line for line in pretty_xml.split('\n') if line.strip()]
-            if lines and lines[0].startswith('<?xml'):
-                lines[0] = '<?xml version="1.0" encoding="utf-8" standalone="no"?>'
-            return '\n'.join(lines)
-        except Exception:
-            return '<?xml version="1.0" encoding="utf-8" standalone="no"?>\n' + xml_str
+            self._write_folder_xml(fp, 'Root Snippets', root_snippets)
+        fp.write('</folders>')
+
+    @staticmethod
+    def _write_folder_xml(fp, name, snippets):
+        """Serialize one <folder> element and write it out."""
+        folder_elem = ET.Element('folder')
+        title_elem = ET.SubElement(folder_elem, 'title')
+        title_elem.text = name
+        snippets_elem = ET.SubElement(folder_elem, 'snippets')
+        for snippet in snippets:
+            snippet_elem = ET.SubElement(snippets_elem, 'snippet')
+            snippet_title = ET.SubElement(snippet_elem, 'title')
+            snippet_title.text = snippet['title']
+            snippet_content = ET.SubElement(snippet_elem, 'content')
+            snippet_content.text = snippet['content']
+        # Indent in place — no minidom re-parse of the serialized string
+        ET.indent(folder_elem, space='  ', level=1)
+        fp.write('  ' + ET.tostring(folder_elem, encoding='unicode') + '\n')
 
     def import_snippets_xml(self, xml_content: str, merge: bool = False):
         """
@@ -304,55 +680,73 @@ class Storage:
         try:
             # Parse XML
             root = ET.fromstring(xml_content)
-            
+
             # Check if root is 'folders' element (Clipy format)
             if root.tag != 'folders':
                 raise ValueError('Invalid Clipy XML format: root element must be <folders>')
-            
-            if not merge:
-                self._conn.execute('DELETE FROM snippets')
-                self._conn.execute('DELETE FROM folders')
-                self._conn.commit()
-            
-            # Import each folder
-            for folder_elem in root.findall('folder'):
-                title_elem = folder_elem.find('title')
-                if title_elem is None or not title_elem.text:
-                    continue
-                
-                folder_name = title_elem.text
-                
-                # Skip "Root Snippets" folder - import as root-level snippets
-                if folder_name == 'Root Snippets':
-                    snippets_elem = folder_elem.find('snippets')
-                    if snippets_elem is not None:
-                        self._import_snippets_from_xml_elem(snippets_elem, None)
-                else:
-                    # Create folder
-                    folder_id = self.add_folder(folder_name)
-                    
-                    # Import snippets in this folder
-                    snippets_elem = folder_elem.find('snippets')
-                    if snippets_elem is not None:
-                        self._import_snippets_from_xml_elem(snippets_elem, folder_id)
-            
-            self._conn.commit()
+
+            # One transaction for the whole import: a 1000-snippet file is
+            # one commit instead of a commit (and fsync) per row. The import
+            # runs on the SnippetIO thread, so it gets its own connection —
+            # sharing self._conn would let a writer-thread commit land
+            # mid-import and split the transaction.
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            try:
+                conn.execute('PRAGMA busy_timeout=2000')
+                with conn:
+                    if not merge:
+                        conn.execute('DELETE FROM snippets')
+                        conn.execute('DELETE FROM folders')
+
+                    rows = []   # (title, content, folder_id)
+                    for folder_elem in root.findall('folder'):
+                        title_elem = folder_elem.find('title')
+                        if title_elem is None or not title_elem.text:
+                            continue
+
+                        folder_name = title_elem.text
+                        snippets_elem = folder_elem.find('snippets')
+                        if snippets_elem is None:
+                            continue
+
+                        # "Root Snippets" folder holds root-level snippets
+                        if folder_name == 'Root Snippets':
+                            folder_id = None
+                        else:
+                            folder_id = conn.execute(
+                                'INSERT INTO folders (name, parent_id) VALUES (?, NULL)',
+                                (folder_name,),
+                            ).lastrowid
+                        rows.extend(self._snippet_rows_from_xml_elem(snippets_elem, folder_id))
+
+                    conn.executemany(
+                        'INSERT INTO snippets (title, content, folder_id) VALUES (?, ?, ?)', rows
+                    )
+                # The table shape just changed wholesale — give the planner
+                # fresh statistics right away instead of waiting for close().
+                try:
+                    conn.execute('ANALYZE')
+                    conn.commit()
+                except sqlite3.Error:
+                    pass
+            finally:
+                conn.close()
             return True
-            
+
         except Exception as e:
-            self._conn.rollback()
             raise ValueError(f'Failed to import snippets: {str(e)}')
 
-    def _import_snippets_from_xml_elem(self, snippets_elem, folder_id):
-        """Import snippets from XML snippets element."""
+    def _snippet_rows_from_xml_elem(self, snippets_elem, folder_id):
+        """Collect (title, content, folder_id) rows from a snippets element."""
+        rows = []
         for snippet_elem in snippets_elem.findall('snippet'):
             title_elem = snippet_elem.find('title')
             content_elem = snippet_elem.find('content')
-            
+
             if title_elem is None or not title_elem.text:
                 continue
-            
+
             title = title_elem.text
             content = content_elem.text if content_elem is not None and content_elem.text else ''
-            
-            self.add_snippet(title, content, folder_id)
+            rows.append((title, content, folder_id))
+        return rows
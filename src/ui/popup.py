@@ -22,7 +22,9 @@ Layout (monochrome flat design):
   └─────────────────────────────┘
 """
 
+import concurrent.futures
 import tkinter as tk
+import tkinter.font as tkfont
 
 # ── Monochrome flat themes ─────────────────────────────────────────────────────
 DARK = dict(
@@ -50,46 +52,71 @@ LIGHT = dict(
     sub_bg='#ffffff',    sub_border='#c0c0c0',
 )
 
+_MODE_LABELS = {
+    'all':      'History + Snippets',
+    'history':  'Clipboard History',
+    'snippets': 'Snippets',
+}
+
 WIN_W, WIN_H = 380, 500
 SUB_W = 240          # submenu width
-MAX_DISPLAY = 75     # chars per item line
+ROW_H = 28           # fixed row height — lets the list be windowed
 HOVER_DELAY  = 140   # ms before submenu appears
 LEAVE_DELAY  = 250   # ms before submenu closes
 CONTENT_DELAY = 400  # ms before content appears
 
 class _Entry:
-    __slots__ = ('kind', 'item_id', 'label', 'content')
+    __slots__ = ('kind', 'item_id', 'label', 'content', 'selectable')
 
     def __init__(self, kind, item_id=None, label='', content=''):
         self.kind    = kind       # 'header' | 'folder' | 'clip' | 'snippet'
         self.item_id = item_id
         self.label   = label
         self.content = content
-
-    @property
-    def selectable(self):
-        return self.kind in ('clip', 'snippet')
+        self.selectable = kind in ('clip', 'snippet')
 
 
 class PopupMenu:
-    def __init__(self, root: tk.Tk, storage, paste_callback):
+    def __init__(self, root: tk.Tk, storage, paste_callback, visibility_cb=None):
         self.root           = root
         self.storage        = storage
         self.paste_callback = paste_callback
+        self.visibility_cb  = visibility_cb   # called with True/False on show/hide
 
         self._win:  tk.Toplevel | None = None
-        self._sub:  tk.Toplevel | None = None   # folder submenu
+        self._sub:  tk.Toplevel | None = None   # folder submenu (recycled)
+        self._sub_canvas = None
+        self._sub_widgets: dict = {}            # recycled submenu skeleton
+        self._sub_rows: list[tuple] = []        # recycled (frame, label) rows
         self._sub_folder_id: int | None = None
 
-        self._entries:    list[_Entry] = []
-        self._row_frames: list[tuple]  = []
+        self._entries: list[_Entry] = []
+        self._snip_cache: dict = {}        # folder_id → snippet rows, per popup-open
+        self._label_cache: dict = {}       # clip id → display label (content is immutable)
+        self._pool:    list[dict]   = []   # recycled row widgets (one per visible line)
+        self._empty_lbl = None             # persistent "no results" label + canvas item
+        self._empty_item = None
         self._sel = -1
+        self._selectable_idx: list[int] = []   # entry indices the arrows cycle
+        self._sel_pos: dict[int, int] = {}     # entry index → position in that list
+
+        # Storage queries run here so a slow search never stalls the
+        # mainloop; results re-enter the Tk thread via root.after.
+        self._fetcher = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='PopupFetch')
 
         self._search_var  = tk.StringVar()
         self._after_search = None
+        self._search_token = 0     # bumps per load; stale results are dropped
+        self._last_query: str | None = None
         self._hover_timer  = None
         self._leave_timer  = None
+        self._wheel_accum = 0      # wheel ticks waiting for the next flush
+        self._wheel_after = None
+        self._win_rect: tuple | None = None   # (x, y, w, h), refreshed on <Configure>
+        self._sub_rect: tuple | None = None
         self._C: dict = {}
+        self._F: dict = {}   # shared Font objects, created on first build
         self._mode = 'all'
         self._tooltip      = None
         self._tooltip_after = None
@@ -98,20 +125,26 @@ class PopupMenu:
 
     def show(self, mode: str = 'all'):
         self._mode = mode
+        self._snip_cache.clear()   # snippets may have changed since last open
         if self._win and self._win.winfo_exists():
-            if getattr(self, '_current_mode', None) != mode:
-                self.hide()
-            else:
-                self._win.lift()
-                self._win.focus_force()
+            theme = self.storage.get_setting('theme', 'dark')
+            if (DARK if theme == 'dark' else LIGHT) is not self._C:
+                # Theme switched since the window was built — rebuilding is
+                # simpler than re-skinning every cached widget, and rare
+                self._win.destroy()
+                self._win = None
+                self._build_window()
                 return
-        self._build_window()
+            self._reopen_window()
+        else:
+            self._build_window()
 
     def hide(self):
         self._close_sub()
         if self._win and self._win.winfo_exists():
-            self._win.destroy()
-        self._win = None
+            self._win.withdraw()   # keep the HWND; next show() just unhides
+        if self.visibility_cb:
+            self.visibility_cb(False)
 
     # ── Window construction ────────────────────────────────────────────────
 
@@ -121,6 +154,16 @@ class PopupMenu:
         C = self._C
         self._current_mode = self._mode
 
+        # One Font object per role: Tk parses/measures the spec once and
+        # every widget shares the resource instead of re-resolving a tuple.
+        if not self._F:
+            self._F = {
+                'small':  tkfont.Font(root=self.root, family='Segoe UI', size=8),
+                'header': tkfont.Font(root=self.root, family='Segoe UI', size=9),
+                'row':    tkfont.Font(root=self.root, family='Segoe UI', size=10),
+                'search': tkfont.Font(root=self.root, family='Segoe UI', size=11),
+            }
+
         win = tk.Toplevel(self.root)
         self._win = win
         win.withdraw()
@@ -128,65 +171,58 @@ class PopupMenu:
         win.attributes('-topmost', True)
         win.configure(bg=C['border'])
 
-        # ── Position ──────────────────────────────────────────────────────
-        scr_w = win.winfo_screenwidth()
-        scr_h = win.winfo_screenheight()
-        px, py = self.root.winfo_pointerx(), self.root.winfo_pointery()
-        x = max(4, min(px, scr_w - WIN_W - 4))
-        y = max(4, min(py, scr_h - WIN_H - 48))
-        win.geometry(f'{WIN_W}x{WIN_H}+{x}+{y}')
+        self._position_window()
+        win.bind('<Configure>', self._on_win_configure)
 
         outer = tk.Frame(win, bg=C['bg'])
         outer.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
 
         # ── Mode bar (minimal, monochrome) ────────────────────────────────
-        mode_label = {
-            'all':      'History + Snippets',
-            'history':  'Clipboard History',
-            'snippets': 'Snippets',
-        }.get(self._mode, '')
         mb = tk.Frame(outer, bg=C['mode_bg'], padx=10, pady=4)
         mb.pack(fill=tk.X)
-        tk.Label(mb, text=mode_label, bg=C['mode_bg'], fg=C['mode_fg'],
-                 font=('Segoe UI', 8)).pack(side=tk.LEFT)
+        self._mode_lbl = tk.Label(mb, text=_MODE_LABELS.get(self._mode, ''),
+                                  bg=C['mode_bg'], fg=C['mode_fg'],
+                                  font=self._F['small'])
+        self._mode_lbl.pack(side=tk.LEFT)
 
         # ── Search bar ────────────────────────────────────────────────────
         sf = tk.Frame(outer, bg=C['search_bg'], padx=8, pady=6)
         sf.pack(fill=tk.X)
         tk.Label(sf, text='Search', bg=C['search_bg'], fg=C['mode_fg'],
-                 font=('Segoe UI', 9)).pack(side=tk.LEFT, padx=(0, 6))
+                 font=self._F['header']).pack(side=tk.LEFT, padx=(0, 6))
         self._search_var.set('')
         self._search_entry = tk.Entry(
             sf, textvariable=self._search_var,
             bg=C['search_bg'], fg=C['search_fg'],
             insertbackground=C['search_cursor'],
-            font=('Segoe UI', 11), relief=tk.FLAT, bd=0,
+            font=self._F['search'], relief=tk.FLAT, bd=0,
         )
         self._search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self._search_entry.focus_set()
         tk.Frame(outer, bg=C['border'], height=1).pack(fill=tk.X)
 
-        # ── Scrollable list ───────────────────────────────────────────────
+        # ── Scrollable list (windowed: only visible rows exist as widgets) ─
         lc = tk.Frame(outer, bg=C['bg'])
         lc.pack(fill=tk.BOTH, expand=True)
-        self._canvas = tk.Canvas(lc, bg=C['bg'], highlightthickness=0, bd=0)
+        self._canvas = tk.Canvas(lc, bg=C['bg'], highlightthickness=0, bd=0,
+                                 yscrollincrement=ROW_H)
         sb = tk.Scrollbar(lc, orient=tk.VERTICAL, command=self._canvas.yview)
-        self._inner = tk.Frame(self._canvas, bg=C['bg'])
-        self._inner.bind('<Configure>',
-                         lambda e: self._canvas.configure(
-                             scrollregion=self._canvas.bbox('all')))
-        self._cw = self._canvas.create_window((0, 0), window=self._inner, anchor='nw')
-        self._canvas.configure(yscrollcommand=sb.set)
-        self._canvas.bind('<Configure>', lambda e: self._canvas.itemconfig(self._cw, width=e.width))
+        # Re-render the visible window whenever the viewport moves or resizes
+        self._canvas.configure(
+            yscrollcommand=lambda lo, hi: (sb.set(lo, hi), self._render_window()))
+        self._canvas.bind('<Configure>', lambda e: self._render_window())
         self._canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self._pool = []
+        self._empty_lbl = None
+        self._empty_item = None
 
         # ── Footer ────────────────────────────────────────────────────────
         tk.Frame(outer, bg=C['border'], height=1).pack(fill=tk.X)
         foot = tk.Frame(outer, bg=C['footer_bg'], padx=8, pady=3)
         foot.pack(fill=tk.X)
         tk.Label(foot, text='↑↓  Enter/Click: Paste   Esc: Close',
-                 bg=C['footer_bg'], fg=C['footer_fg'], font=('Segoe UI', 8)).pack()
+                 bg=C['footer_bg'], fg=C['footer_fg'], font=self._F['small']).pack()
 
         # ── Bindings ─────────────────────────────────────────────────────
         for w in (win, self._search_entry):
@@ -194,21 +230,81 @@ class PopupMenu:
             w.bind('<Up>',     lambda e: self._move(-1))
             w.bind('<Down>',   lambda e: self._move(1))
             w.bind('<Return>', lambda e: self._activate())
-        win.bind('<MouseWheel>',
-                 lambda e: self._canvas.yview_scroll(-1 * (e.delta // 120), 'units'))
+        win.bind('<MouseWheel>', self._on_wheel)
         win.bind('<FocusOut>', self._on_focus_out)
         self._search_var.trace_add('write', lambda *_: self._schedule_search())
 
+        # Row events are bound once per synthetic bindtag class; widgets
+        # carry a back-reference instead of three closures each.
+        win.bind_class('ClipyRow', '<Button-1>', self._row_btn1)
+        win.bind_class('ClipyRow', '<Enter>',    self._row_enter)
+        win.bind_class('ClipyRow', '<Leave>',    self._row_leave)
+        win.bind_class('ClipySub', '<Button-1>', self._subrow_btn1)
+        win.bind_class('ClipySub', '<Enter>',    self._subrow_enter)
+        win.bind_class('ClipySub', '<Leave>',    self._subrow_leave)
+
         self._load_items()
         win.deiconify()
         win.lift()
         win.focus_force()
+        if self.visibility_cb:
+            self.visibility_cb(True)
+
+    def _position_window(self):
+        win = self._win
+        scr_w = win.winfo_screenwidth()
+        scr_h = win.winfo_screenheight()
+        px, py = self.root.winfo_pointerx(), self.root.winfo_pointery()
+        x = max(4, min(px, scr_w - WIN_W - 4))
+        y = max(4, min(py, scr_h - WIN_H - 48))
+        win.geometry(f'{WIN_W}x{WIN_H}+{x}+{y}')
+        self._win_rect = (x, y, WIN_W, WIN_H)
+
+    def _reopen_window(self):
+        """Reuse the pooled window: retitle, reposition, reload, unhide."""
+        self._current_mode = self._mode
+        self._mode_lbl.configure(text=_MODE_LABELS.get(self._mode, ''))
+        self._position_window()
+        self._search_var.set('')
+        self._load_items()
+        win = self._win
+        win.deiconify()
+        win.lift()
+        win.focus_force()
+        self._search_entry.focus_set()
+        if self.visibility_cb:
+            self.visibility_cb(True)
+
+    # ── Scrolling ─────────────────────────────────────────────────────────
+
+    def _on_wheel(self, event):
+        # A fast wheel spin fires ~10 events per detent on Windows; batch
+        # them and move the canvas once per ~frame instead of per tick.
+        self._wheel_accum += -(event.delta // 120)
+        if self._wheel_after is None:
+            self._wheel_after = self.root.after(16, self._flush_wheel)
+
+    def _flush_wheel(self):
+        self._wheel_after = None
+        delta, self._wheel_accum = self._wheel_accum, 0
+        if delta and self._win and self._win.winfo_exists():
+            self._canvas.yview_scroll(delta, 'units')
 
     # ── Focus handling ────────────────────────────────────────────────────
 
     def _on_focus_out(self, _event=None):
         self.root.after(120, self._check_focus)
 
+    @staticmethod
+    def _is_descendant(widget, top) -> bool:
+        """Parent-chain walk — a few attribute hops, no path-string
+        allocation, and immune to sibling paths sharing a prefix."""
+        while widget is not None:
+            if widget is top:
+                return True
+            widget = getattr(widget, 'master', None)
+        return False
+
     def _check_focus(self):
         try:
             if not (self._win and self._win.winfo_exists()):
@@ -216,10 +312,10 @@ class PopupMenu:
             focused = self._win.focus_get()
             # Keep open if focus is inside main popup or submenu
             if focused is not None:
-                fs = str(focused)
-                if fs.startswith(str(self._win)):
+                if self._is_descendant(focused, self._win):
                     return
-                if self._sub and self._sub.winfo_exists() and fs.startswith(str(self._sub)):
+                if self._sub and self._sub.winfo_exists() and \
+                        self._is_descendant(focused, self._sub):
                     return
             self.hide()
         except Exception:
@@ -230,151 +326,299 @@ class PopupMenu:
     def _schedule_search(self):
         if self._after_search:
             self.root.after_cancel(self._after_search)
-        self._after_search = self.root.after(120, self._load_items)
+        self._after_search = self.root.after(200, self._on_search_changed)
+
+    def _on_search_changed(self):
+        self._after_search = None
+        # Modifier keys fire the trace without changing the text — skip
+        if self._search_var.get().strip() == self._last_query:
+            return
+        self._load_items()
 
     def _load_items(self):
         self._close_sub()
-        for w in self._inner.winfo_children():
-            w.destroy()
-        self._entries = []
-        self._row_frames = []
-        self._sel = -1
-
-        search = self._search_var.get().strip() or None
-        C = self._C
+        self._search_token += 1
+        token = self._search_token
+        search_text = self._search_var.get().strip()
+        self._last_query = search_text
+        search = search_text or None
         mode = self._mode
-
-        # ── History ───────────────────────────────────────────────────────
+        # Query on the worker, apply on the Tk thread
+        fut = self._fetcher.submit(self._fetch_entries, search, mode, token)
+        fut.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._apply_entries(f, token)))
+
+    def _fetch_entries(self, search, mode, token):
+        """Worker-side: run the storage queries and build the entry list."""
+        # Query everything first: the row counts size the list exactly,
+        # so it is allocated once instead of growing append by append.
+        clips = snips = folders = ()
         if mode in ('all', 'history'):
-            clips = self.storage.get_clips(search=search)
-            if clips:
-                self._add_section('CLIPBOARD HISTORY')
-                for clip in clips:
-                    text = clip['content'][:MAX_DISPLAY].replace('\n', ' ').strip()
-                    if len(clip['content']) > MAX_DISPLAY:
-                        text += '…'
-                    self._add_row(_Entry('clip', clip['id'], text, clip['content']))
-
-        # ── Snippets ─────────────────────────────────────────────────────
+            clips = self.storage.get_clip_previews(search=search)
+            if token != self._search_token:
+                return None   # a newer query superseded this one mid-load
         if mode in ('all', 'snippets'):
             if search:
-                snips = self.storage.get_snippets(search=search)
-                if snips:
-                    self._add_section('SNIPPETS')
-                    for s in snips:
-                        self._add_row(_Entry('snippet', s['id'], s['title'], s['content']))
+                snips = self.storage.get_snippet_titles(search=search)
+                if token != self._search_token:
+                    return None
             else:
-                folders = self.storage.get_folders_by_usage()
-                if folders:
-                    self._add_section('SNIPPETS')
-                    for folder in folders:
-                        # Only show folder if it has snippets
-                        if self.storage.get_snippets(folder_id=folder['id']):
-                            self._add_folder_row(folder['id'], folder['name'])
-
-        if not self._entries:
+                # Emptiness is decided by the join — no per-folder query
+                folders = self.storage.get_folders_with_snippets()
+
+        n = (len(clips) + bool(clips)
+             + len(snips) + len(folders) + bool(snips or folders))
+        entries: list[_Entry] = [None] * n
+        i = 0
+
+        # ── History ───────────────────────────────────────────────────────
+        if clips:
+            entries[i] = _Entry('header', label='CLIPBOARD HISTORY')
+            i += 1
+            # A clip's content never changes for a given id, so the label
+            # build is done once per clip, not per open.
+            label_cache = self._label_cache
+            if len(label_cache) > 4096:
+                label_cache.clear()
+            for clip in clips:
+                cid = clip['id']
+                text = label_cache.get(cid)
+                if text is None:
+                    # Preview arrives display-ready from SQL; only the
+                    # ellipsis is appended here
+                    text = clip['preview'] + ('…' if clip['trunc'] else '')
+                    label_cache[cid] = text
+                # Full content is fetched from storage on paste
+                entries[i] = _Entry('clip', cid, text)
+                i += 1
+
+        # ── Snippets ─────────────────────────────────────────────────────
+        if snips or folders:
+            entries[i] = _Entry('header', label='SNIPPETS')
+            i += 1
+            for s in snips:
+                entries[i] = _Entry('snippet', s['id'], s['title'])
+                i += 1
+            for folder in folders:
+                entries[i] = _Entry('folder', folder['id'], folder['name'])
+                i += 1
+
+        return entries
+
+    def _apply_entries(self, fut, token):
+        """Tk-side: swap the fetched entries into the rendered list."""
+        if token != self._search_token:
+            return
+        if not (self._win and self._win.winfo_exists()):
+            return
+        try:
+            entries = fut.result()
+        except Exception as e:
+            print(f'[Clipy] popup load error: {e}')
+            return
+        if entries is None:
+            return   # fetch bailed out as stale
+        self._entries = entries
+        self._sel = -1
+        C = self._C
+        search = self._last_query or None
+        mode = self._mode
+
+        # Rebind the pool from scratch: entry indices have all changed
+        for slot in self._pool:
+            slot['idx'] = -1
+            self._canvas.coords(slot['item'], 0, -ROW_H)
+
+        n = len(entries)
+        self._selectable_idx = [i for i, e in enumerate(entries) if e.selectable]
+        self._sel_pos = {i: k for k, i in enumerate(self._selectable_idx)}
+        # Scrollregion follows straight from the entry count — no bbox scan
+        self._canvas.configure(scrollregion=(0, 0, WIN_W, n * ROW_H))
+        self._canvas.yview_moveto(0)
+
+        if not n:
             msg = 'No results found' if search else (
                 'Clipboard is empty' if mode in ('all', 'history') else
                 'No snippets registered'
             )
-            tk.Label(self._inner, text=msg, bg=C['bg'], fg=C['header_fg'],
-                     font=('Segoe UI', 10), pady=28).pack()
+            # Created once, then just retexted and toggled — the common
+            # "typing yields no results" transient stops churning widgets
+            if self._empty_lbl is None:
+                self._empty_lbl = tk.Label(self._canvas, bg=C['bg'],
+                                           fg=C['header_fg'], font=self._F['row'])
+                self._empty_item = self._canvas.create_window(
+                    WIN_W // 2, 64, window=self._empty_lbl)
+            self._empty_lbl.configure(text=msg)
+            self._canvas.itemconfigure(self._empty_item, state='normal')
             return
-
-        for i, e in enumerate(self._entries):
-            if e.selectable:
-                self._set_selection(i)
-                break
-
-    def _add_section(self, text: str):
+        if self._empty_item is not None:
+            self._canvas.itemconfigure(self._empty_item, state='hidden')
+
+        self._render_window()
+        if self._selectable_idx:
+            self._set_selection(self._selectable_idx[0])
+
+    def _cached_snippets(self, folder_id: int):
+        """Folder snippets, queried at most once per popup-open: the filter
+        loop in _load_items and the hover submenu share the same rows."""
+        rows = self._snip_cache.get(folder_id)
+        if rows is None:
+            rows = self.storage.get_snippet_titles(folder_id=folder_id)
+            self._snip_cache[folder_id] = rows
+        return rows
+
+    # ── Windowed rendering ────────────────────────────────────────────────
+
+    def _make_slot(self) -> dict:
+        """One recyclable row: a Frame + text Label + folder arrow, parked
+        off-canvas until _render_window assigns it an entry index."""
         C = self._C
-        f = tk.Frame(self._inner, bg=C['header_bg'], padx=10, pady=3)
-        f.pack(fill=tk.X)
-        tk.Label(f, text=text, bg=C['header_bg'], fg=C['header_fg'],
-                 font=('Segoe UI', 8)).pack(anchor='w')
-        self._entries.append(_Entry('header', label=text))
-        self._row_frames.append((None, None))
-
-    def _add_row(self, entry: _Entry):
-        C   = self._C
-        idx = len(self._entries)
-        icon = '◦' if entry.kind == 'clip' else '·'
-        f = tk.Frame(self._inner, bg=C['bg'], padx=10, pady=4, cursor='hand2')
-        f.pack(fill=tk.X)
-        lbl = tk.Label(
-            f, text=f'{icon}  {entry.label}',
-            bg=C['bg'], fg=C['fg'],
-            font=('Segoe UI', 10), anchor='w',
-            wraplength=WIN_W - 32, justify=tk.LEFT,
-        )
-        lbl.pack(anchor='w', fill=tk.X)
-        for w in (f, lbl):
-            w.bind('<Button-1>', lambda e, i=idx: self._on_click(i))
-            w.bind('<Enter>',    lambda e, i=idx: self._on_hover(i))
-            w.bind('<Leave>',    lambda e, i=idx: self._on_leave(i))
-        self._entries.append(entry)
-        self._row_frames.append((f, lbl))
-
-    # ── Folder row (with > and submenu on hover) ──────────────────────────
-
-    def _add_folder_row(self, folder_id: int, name: str):
-        C   = self._C
-        idx = len(self._entries)
-        f   = tk.Frame(self._inner, bg=C['bg'], padx=10, pady=4, cursor='hand2')
-        f.pack(fill=tk.X)
-        lbl = tk.Label(f, text=f'  {name}', bg=C['bg'], fg=C['folder_fg'],
-                       font=('Segoe UI', 10), anchor='w')
-        lbl.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        arrow = tk.Label(f, text='>', bg=C['bg'], fg=C['folder_fg'],
-                         font=('Segoe UI', 8))
+        f = tk.Frame(self._canvas, bg=C['bg'], padx=10, cursor='hand2')
+        lbl = tk.Label(f, text='', bg=C['bg'], fg=C['fg'],
+                       font=self._F['row'], anchor='w')
+        lbl.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        arrow = tk.Label(f, text='', bg=C['bg'], fg=C['folder_fg'],
+                         font=self._F['small'])
         arrow.pack(side=tk.RIGHT)
-
+        item = self._canvas.create_window(0, -ROW_H, window=f, anchor='nw',
+                                          width=WIN_W - 2, height=ROW_H)
+        slot = {'frame': f, 'label': lbl, 'arrow': arrow, 'item': item, 'idx': -1}
         for w in (f, lbl, arrow):
-            w.bind('<Enter>', lambda e, fid=folder_id, fn=name, fr=f:
-                   self._folder_enter(fid, fn, fr))
-            w.bind('<Leave>', lambda e, fr=f: self._folder_leave(fr))
-            w.bind('<Button-1>', lambda e, fid=folder_id, fn=name, fr=f:
-                   self._open_sub(fid, fn, fr))
-
-        self._entries.append(_Entry('folder', folder_id, name))
-        self._row_frames.append((f, lbl))
+            w._clipy_slot = slot
+            w.bindtags(('ClipyRow',) + w.bindtags())
+        return slot
+
+    def _row_btn1(self, event):
+        slot = getattr(event.widget, '_clipy_slot', None)
+        if slot is not None:
+            self._slot_click(slot)
+
+    def _row_enter(self, event):
+        slot = getattr(event.widget, '_clipy_slot', None)
+        if slot is not None:
+            self._slot_enter(slot)
+
+    def _row_leave(self, event):
+        slot = getattr(event.widget, '_clipy_slot', None)
+        if slot is not None:
+            self._slot_leave(slot)
+
+    def _render_window(self):
+        """Bind the widget pool to the entry indices currently in view."""
+        if not (self._win and self._win.winfo_exists()):
+            return
+        canvas = self._canvas
+        n = len(self._entries)
+        first = max(0, int(canvas.canvasy(0) // ROW_H))
+        need = min(canvas.winfo_height() // ROW_H + 2, n - first)
+        while len(self._pool) < need:
+            self._pool.append(self._make_slot())
+        for k, slot in enumerate(self._pool):
+            idx = first + k
+            if k >= need or idx >= n:
+                if slot['idx'] != -1:
+                    canvas.coords(slot['item'], 0, -ROW_H)
+                    slot['idx'] = -1
+                continue
+            canvas.coords(slot['item'], 0, idx * ROW_H)
+            if slot['idx'] != idx:
+                slot['idx'] = idx
+                self._style_slot(slot)
+
+    def _style_slot(self, slot: dict, hover: bool = False):
+        C = self._C
+        idx = slot['idx']
+        e = self._entries[idx]
+        if e.kind == 'header':
+            bg, fg = C['header_bg'], C['header_fg']
+            text, arrow, font, cursor = e.label, '', self._F['small'], 'arrow'
+        elif e.kind == 'folder':
+            bg = C['select_bg'] if hover else C['bg']
+            fg = C['fg'] if hover else C['folder_fg']
+            text, arrow, font, cursor = f'  {e.label}', '>', self._F['row'], 'hand2'
+        else:
+            icon = '◦' if e.kind == 'clip' else '·'
+            if idx == self._sel:
+                bg, fg = C['select_bg'], C['select_fg']
+            elif hover:
+                bg, fg = C['hover_bg'], C['fg']
+            else:
+                bg, fg = C['bg'], C['fg']
+            text, arrow, font, cursor = f'{icon}  {e.label}', '', self._F['row'], 'hand2'
+        slot['frame'].configure(bg=bg, cursor=cursor)
+        slot['label'].configure(text=text, bg=bg, fg=fg, font=font)
+        slot['arrow'].configure(text=arrow, bg=bg, fg=fg)
+
+    def _slot_for(self, idx: int):
+        for slot in self._pool:
+            if slot['idx'] == idx:
+                return slot
+        return None
+
+    def _slot_click(self, slot: dict):
+        idx = slot['idx']
+        if idx < 0:
+            return
+        e = self._entries[idx]
+        if e.kind == 'folder':
+            self._open_sub(e.item_id, e.label, slot['frame'])
+        elif e.selectable:
+            self._set_selection(idx)
+            self._paste(e)
+
+    def _slot_enter(self, slot: dict):
+        idx = slot['idx']
+        if idx < 0:
+            return
+        e = self._entries[idx]
+        if e.kind == 'folder':
+            self._cancel_hover_timer()
+            self._style_slot(slot, hover=True)
+            self._hover_timer = self.root.after(
+                HOVER_DELAY,
+                lambda: self._open_sub(e.item_id, e.label, slot['frame']))
+        elif e.selectable:
+            self._close_sub()
+            if idx != self._sel:
+                self._style_slot(slot, hover=True)
+
+    def _slot_leave(self, slot: dict):
+        idx = slot['idx']
+        if idx < 0:
+            return
+        e = self._entries[idx]
+        if e.kind == 'folder':
+            self._cancel_hover_timer()
+            self._style_slot(slot)
+            self._leave_timer = self.root.after(LEAVE_DELAY, self._maybe_close_sub)
+        elif idx != self._sel:
+            self._style_slot(slot)
 
     # ── Submenu ───────────────────────────────────────────────────────────
 
-    def _folder_enter(self, folder_id: int, name: str, frame):
-        self._cancel_hover_timer()
-        C = self._C
-        frame.configure(bg=C['select_bg'])
-        for child in frame.winfo_children():
-            if isinstance(child, tk.Label):
-                child.configure(bg=C['select_bg'], fg=C['fg'])
-        self._hover_timer = self.root.after(
-            HOVER_DELAY, lambda: self._open_sub(folder_id, name, frame)
-        )
+    def _on_win_configure(self, event):
+        # Children propagate <Configure> up; only track the toplevel itself
+        if event.widget is self._win:
+            self._win_rect = (event.x, event.y, event.width, event.height)
 
-    def _folder_leave(self, frame=None):
-        self._cancel_hover_timer()
-        if frame:
-            C = self._C
-            frame.configure(bg=C['bg'])
-            for child in frame.winfo_children():
-                if isinstance(child, tk.Label):
-                    child.configure(bg=C['bg'], fg=C['folder_fg'])
-        self._leave_timer = self.root.after(LEAVE_DELAY, self._maybe_close_sub)
+    def _on_sub_configure(self, event):
+        if event.widget is self._sub:
+            self._sub_rect = (event.x, event.y, event.width, event.height)
 
     def _maybe_close_sub(self):
-        if not (self._sub and self._sub.winfo_exists()):
-            return
+        if self._sub_folder_id is None:
+            return   # nothing showing (the recycled window may merely exist)
         try:
+            # Geometry is cached when the windows are placed; the pointer
+            # position is the only per-tick round-trip left.
             mx, my = self.root.winfo_pointerx(), self.root.winfo_pointery()
-            sx, sy = self._sub.winfo_x(), self._sub.winfo_y()
-            sw, sh = self._sub.winfo_width(), self._sub.winfo_height()
-            if sx <= mx <= sx + sw and sy <= my <= sy + sh:
-                return  # Mouse inside submenu — keep open
+            if self._sub_rect:
+                sx, sy, sw, sh = self._sub_rect
+                if sx <= mx <= sx + sw and sy <= my <= sy + sh:
+                    return  # Mouse inside submenu — keep open
             # Also keep open if mouse is over the main popup
-            if self._win and self._win.winfo_exists():
-                wx, wy = self._win.winfo_x(), self._win.winfo_y()
-                ww, wh = self._win.winfo_width(), self._win.winfo_height()
+            if self._win_rect and self._win and self._win.winfo_exists():
+                wx, wy, ww, wh = self._win_rect
                 if wx <= mx <= wx + ww and wy <= my <= wy + wh:
                     return
         except Exception:
@@ -388,53 +632,55 @@ class PopupMenu:
         self._close_sub()
         self._sub_folder_id = folder_id
 
-        snippets = self.storage.get_snippets(folder_id=folder_id)
+        snippets = self._cached_snippets(folder_id)
         if not snippets:
             return
 
         C = self._C
-        sub = tk.Toplevel(self.root)
-        self._sub = sub
-        sub.withdraw()
-        sub.overrideredirect(True)
-        sub.attributes('-topmost', True)
-        sub.configure(bg=C['sub_border'])
-
-        outer = tk.Frame(sub, bg=C['bg'])
-        outer.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
-
-        # Header
-        hf = tk.Frame(outer, bg=C['header_bg'], padx=10, pady=4)
-        hf.pack(fill=tk.X)
-        tk.Label(hf, text=f'  {name}', bg=C['header_bg'], fg=C['folder_fg'],
-                 font=('Segoe UI', 8)).pack(anchor='w')
-        tk.Frame(outer, bg=C['border'], height=1).pack(fill=tk.X)
-
-        # Scrollable snippet list
         SUB_MAX_H = 320
-        lc = tk.Frame(outer, bg=C['bg'])
-        lc.pack(fill=tk.BOTH, expand=True)
-        sub_canvas = tk.Canvas(lc, bg=C['bg'], highlightthickness=0, bd=0)
-        sb = tk.Scrollbar(lc, orient=tk.VERTICAL, command=sub_canvas.yview)
-        inner = tk.Frame(sub_canvas, bg=C['bg'])
-        inner.bind('<Configure>', lambda e: sub_canvas.configure(
-            scrollregion=sub_canvas.bbox('all')))
-        cw = sub_canvas.create_window((0, 0), window=inner, anchor='nw')
-        sub_canvas.configure(yscrollcommand=sb.set)
-        sub_canvas.bind('<Configure>', lambda e: sub_canvas.itemconfig(cw, width=e.width))
+        sub = self._ensure_sub()
+        W = self._sub_widgets
 
-        for s in snippets:
-            entry = _Entry('snippet', s['id'], s['title'], s['content'])
-            self._add_sub_item(inner, entry, C)
+        # Re-skin the recycled shell for the current theme and folder
+        sub.configure(bg=C['sub_border'])
+        W['outer'].configure(bg=C['bg'])
+        W['hf'].configure(bg=C['header_bg'])
+        W['header'].configure(text=f'  {name}', bg=C['header_bg'], fg=C['folder_fg'])
+        W['sep'].configure(bg=C['border'])
+        W['lc'].configure(bg=C['bg'])
+        W['inner'].configure(bg=C['bg'])
+        sub_canvas = self._sub_canvas
+        sub_canvas.configure(bg=C['bg'])
+
+        # Recycle row widgets: reconfigure what exists, grow on demand,
+        # pack_forget the surplus — no destroy/create per folder hover
+        rows = self._sub_rows
+        for i, s in enumerate(snippets):
+            entry = _Entry('snippet', s['id'], s['title'])
+            if i < len(rows):
+                f, lbl = rows[i]
+            else:
+                f, lbl = self._add_sub_item(W['inner'])
+                rows.append((f, lbl))
+            f._clipy_sub = lbl._clipy_sub = (entry, f, lbl)
+            f.configure(bg=C['bg'])
+            lbl.configure(text=f'  {entry.label}', bg=C['bg'], fg=C['fg'])
+            if not f.winfo_manager():
+                f.pack(fill=tk.X)
+        for f, _lbl in rows[len(snippets):]:
+            f.pack_forget()
 
         sub_canvas.update_idletasks()
-        items_h = inner.winfo_reqheight()
-        sub_canvas.configure(height=min(items_h, SUB_MAX_H))
-        sub_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        items_h = W['inner'].winfo_reqheight()
+        # The list never changes after build — set the scrollregion once
+        # instead of re-scanning bbox('all') on every child <Configure>
+        sub_canvas.configure(height=min(items_h, SUB_MAX_H),
+                             scrollregion=(0, 0, SUB_W - 2, items_h))
+        sub_canvas.yview_moveto(0)
         if items_h > SUB_MAX_H:
-            sb.pack(side=tk.RIGHT, fill=tk.Y)
-        sub.bind('<MouseWheel>',
-                 lambda e: sub_canvas.yview_scroll(-1 * (e.delta // 120), 'units'))
+            W['sb'].pack(side=tk.RIGHT, fill=tk.Y)
+        else:
+            W['sb'].pack_forget()
 
         # Position: to the right of the main popup at the folder row's y
         sub.update_idletasks()
@@ -454,32 +700,85 @@ class PopupMenu:
         y = max(y, 4)
 
         sub.geometry(f'{SUB_W}x{sub_h}+{x}+{y}')
+        self._sub_rect = (x, y, SUB_W, sub_h)
+
+        sub.deiconify()
+        sub.lift()
 
+    def _ensure_sub(self) -> tk.Toplevel:
+        """The submenu Toplevel and its whole skeleton (header, canvas,
+        scrollbar, row frames) are created once and recycled across folder
+        hovers — no HWND or widget create/destroy per hover."""
+        if self._sub and self._sub.winfo_exists():
+            return self._sub
+        sub = tk.Toplevel(self.root)
+        sub.withdraw()
+        sub.overrideredirect(True)
+        sub.attributes('-topmost', True)
+        sub.bind('<Configure>', self._on_sub_configure)
         sub.bind('<Enter>', lambda e: self._cancel_leave_timer())
         sub.bind('<Leave>', lambda e: self._sub_leave())
         sub.bind('<Escape>', lambda e: self.hide())
+        sub.bind('<MouseWheel>', self._on_sub_wheel)
 
-        sub.deiconify()
-        sub.lift()
+        outer = tk.Frame(sub)
+        outer.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        hf = tk.Frame(outer, padx=10, pady=4)
+        hf.pack(fill=tk.X)
+        header = tk.Label(hf, font=self._F['small'])
+        header.pack(anchor='w')
+        sep = tk.Frame(outer, height=1)
+        sep.pack(fill=tk.X)
+        lc = tk.Frame(outer)
+        lc.pack(fill=tk.BOTH, expand=True)
+        sub_canvas = tk.Canvas(lc, highlightthickness=0, bd=0)
+        sb = tk.Scrollbar(lc, orient=tk.VERTICAL, command=sub_canvas.yview)
+        inner = tk.Frame(sub_canvas)
+        # Fixed row width: no reflow binding needed, Tk just clips the text
+        sub_canvas.create_window((0, 0), window=inner, anchor='nw', width=SUB_W - 2)
+        sub_canvas.configure(yscrollcommand=sb.set)
+        sub_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-    def _add_sub_item(self, parent, entry: _Entry, C: dict):
-        f = tk.Frame(parent, bg=C['bg'], padx=10, pady=5, cursor='hand2')
-        f.pack(fill=tk.X)
-        lbl = tk.Label(f, text=f'  {entry.label}', bg=C['bg'], fg=C['fg'],
-                       font=('Segoe UI', 10), anchor='w',
-                       wraplength=SUB_W - 24)
+        self._sub = sub
+        self._sub_canvas = sub_canvas
+        self._sub_widgets = {'outer': outer, 'hf': hf, 'header': header,
+                             'sep': sep, 'lc': lc, 'inner': inner, 'sb': sb}
+        self._sub_rows = []
+        return sub
+
+    def _on_sub_wheel(self, event):
+        if self._sub_canvas is not None:
+            self._sub_canvas.yview_scroll(-(event.delta // 120), 'units')
+
+    def _add_sub_item(self, parent):
+        """Create one recyclable submenu row; text/colors and the entry
+        back-reference are assigned by _open_sub per folder."""
+        f = tk.Frame(parent, padx=10, pady=5, cursor='hand2')
+        lbl = tk.Label(f, font=self._F['row'], anchor='w')
         lbl.pack(anchor='w', fill=tk.X)
         for w in (f, lbl):
-            w.bind('<Button-1>', lambda e, en=entry: self._sub_select(en))
-            w.bind('<Enter>',    lambda e, fr=f, lb=lbl, ct=entry.content:
-                   self._sub_item_enter(fr, lb, ct, C))
-            w.bind('<Leave>',    lambda e, fr=f, lb=lbl:
-                   self._sub_item_leave(fr, lb, C))
+            w.bindtags(('ClipySub',) + w.bindtags())
+        return f, lbl
+
+    def _subrow_btn1(self, event):
+        hit = getattr(event.widget, '_clipy_sub', None)
+        if hit is not None:
+            self._sub_select(hit[0])
+
+    def _subrow_enter(self, event):
+        hit = getattr(event.widget, '_clipy_sub', None)
+        if hit is not None:
+            self._sub_item_enter(hit[1], hit[2], hit[0], self._C)
+
+    def _subrow_leave(self, event):
+        hit = getattr(event.widget, '_clipy_sub', None)
+        if hit is not None:
+            self._sub_item_leave(hit[1], hit[2], self._C)
 
-    def _sub_item_enter(self, frame, lbl, content: str, C: dict):
+    def _sub_item_enter(self, frame, lbl, entry: _Entry, C: dict):
         frame.configure(bg=C['select_bg'])
         lbl.configure(bg=C['select_bg'], fg=C['select_fg'])
-        self._schedule_tooltip(content, frame)
+        self._schedule_tooltip(entry, frame)
 
     def _sub_item_leave(self, frame, lbl, C: dict):
         frame.configure(bg=C['bg'])
@@ -488,18 +787,37 @@ class PopupMenu:
 
     # ── Tooltip ───────────────────────────────────────────────────────────
 
-    def _schedule_tooltip(self, content: str, widget):
+    def _schedule_tooltip(self, entry: _Entry, widget):
         self._hide_tooltip()
         self._tooltip_after = self.root.after(
-            CONTENT_DELAY, lambda: self._show_tooltip(content, widget)
+            CONTENT_DELAY, lambda: self._show_tooltip(entry, widget)
         )
 
-    def _show_tooltip(self, content: str, widget):
+    def _ensure_tooltip(self) -> tk.Toplevel:
+        """One persistent tooltip window, re-skinned per hover."""
+        if self._tooltip and self._tooltip.winfo_exists():
+            return self._tooltip
+        tip = tk.Toplevel(self.root)
+        tip.withdraw()
+        tip.overrideredirect(True)
+        tip.attributes('-topmost', True)
+        self._tooltip_inner = tk.Frame(tip, padx=10, pady=8)
+        self._tooltip_inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        self._tooltip_label = tk.Label(self._tooltip_inner, font=self._F['header'],
+                                       anchor='w', justify=tk.LEFT)
+        self._tooltip_label.pack(anchor='w')
+        self._tooltip = tip
+        return tip
+
+    def _show_tooltip(self, entry: _Entry, widget):
         self._tooltip_after = None
-        if not (self._sub and self._sub.winfo_exists()):
+        if self._sub_folder_id is None or not (self._sub and self._sub.winfo_exists()):
             return
         C = self._C
 
+        # Content is fetched only now, after the hover delay elapsed
+        content = self.storage.get_snippet_content(entry.item_id)
+
         # Build preview: max 8 lines, max 60 chars per line
         lines = content.split('\n')
         preview_lines = []
@@ -509,17 +827,10 @@ class PopupMenu:
             preview_lines.append('…')
         preview = '\n'.join(preview_lines)
 
-        tip = tk.Toplevel(self.root)
-        self._tooltip = tip
-        tip.withdraw()
-        tip.overrideredirect(True)
-        tip.attributes('-topmost', True)
+        tip = self._ensure_tooltip()
         tip.configure(bg=C['border'])
-
-        inner = tk.Frame(tip, bg=C['header_bg'], padx=10, pady=8)
-        inner.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
-        tk.Label(inner, text=preview, bg=C['header_bg'], fg=C['fg'],
-                 font=('Segoe UI', 9), anchor='w', justify=tk.LEFT).pack(anchor='w')
+        self._tooltip_inner.configure(bg=C['header_bg'])
+        self._tooltip_label.configure(text=preview, bg=C['header_bg'], fg=C['fg'])
 
         tip.update_idletasks()
         tip_w = tip.winfo_reqwidth()
@@ -551,13 +862,11 @@ class PopupMenu:
             self.root.after_cancel(self._tooltip_after)
             self._tooltip_after = None
         if self._tooltip and self._tooltip.winfo_exists():
-            self._tooltip.destroy()
-        self._tooltip = None
+            self._tooltip.withdraw()
 
     def _sub_select(self, entry: _Entry):
         self._close_sub()
-        self.hide()
-        self.paste_callback(entry.content, source_id=entry.item_id, source_type=entry.kind)
+        self._paste(entry)
 
     def _sub_leave(self):
         self._cancel_leave_timer()
@@ -568,8 +877,8 @@ class PopupMenu:
         self._cancel_leave_timer()
         self._hide_tooltip()
         if self._sub and self._sub.winfo_exists():
-            self._sub.destroy()
-        self._sub = None
+            self._sub.withdraw()
+        self._sub_rect = None
         self._sub_folder_id = None
 
     def _cancel_hover_timer(self):
@@ -585,33 +894,30 @@ class PopupMenu:
     # ── Selection / navigation ────────────────────────────────────────────
 
     def _set_selection(self, idx: int):
-        C = self._C
-        if 0 <= self._sel < len(self._row_frames):
-            pf, pl = self._row_frames[self._sel]
-            if pf:
-                pf.configure(bg=C['bg'])
-                if pl:
-                    pl.configure(bg=C['bg'], fg=C['fg'])
+        prev = self._sel
         self._sel = idx
-        if 0 <= idx < len(self._row_frames):
-            nf, nl = self._row_frames[idx]
-            if nf:
-                nf.configure(bg=C['select_bg'])
-                if nl:
-                    nl.configure(bg=C['select_bg'], fg=C['select_fg'])
-                nf.update_idletasks()
-                self._canvas.yview_moveto(
-                    nf.winfo_y() / max(1, self._inner.winfo_height())
-                )
+        # Scroll the selected row into view; positions are arithmetic now
+        total_h = max(1, len(self._entries) * ROW_H)
+        top = self._canvas.canvasy(0)
+        view_h = self._canvas.winfo_height()
+        y = idx * ROW_H
+        if y < top:
+            self._canvas.yview_moveto(y / total_h)
+        elif y + ROW_H > top + view_h:
+            self._canvas.yview_moveto((y + ROW_H - view_h) / total_h)
+        for i in (prev, idx):
+            slot = self._slot_for(i) if i >= 0 else None
+            if slot:
+                self._style_slot(slot)
 
     def _move(self, delta: int):
-        sel = [i for i, e in enumerate(self._entries) if e.selectable]
+        sel = self._selectable_idx
         if not sel:
             return
-        if self._sel not in sel:
+        pos = self._sel_pos.get(self._sel)
+        if pos is None:
             self._set_selection(sel[0])
             return
-        pos = sel.index(self._sel)
         self._set_selection(sel[(pos + delta) % len(sel)])
 
     def _activate(self):
@@ -620,34 +926,13 @@ class PopupMenu:
             if e.selectable:
                 self._paste(e)
 
-    def _on_click(self, idx: int):
-        if 0 <= idx < len(self._entries):
-            e = self._entries[idx]
-            if e.selectable:
-                self._set_selection(idx)
-                self._paste(e)
-
-    def _on_hover(self, idx: int):
-        self._close_sub()
-        if idx != self._sel:
-            C = self._C
-            f, l = self._row_frames[idx]
-            if f:
-                f.configure(bg=C['hover_bg'])
-                if l:
-                    l.configure(bg=C['hover_bg'])
-
-    def _on_leave(self, idx: int):
-        if idx != self._sel:
-            C = self._C
-            f, l = self._row_frames[idx]
-            if f:
-                f.configure(bg=C['bg'])
-                if l:
-                    l.configure(bg=C['bg'], fg=C['fg'])
-
     # ── Paste ─────────────────────────────────────────────────────────────
 
     def _paste(self, entry: _Entry):
+        # Rows carry only previews/titles; the payload is fetched here
+        if entry.kind == 'clip':
+            content = self.storage.get_clip_content(entry.item_id)
+        else:
+            content = self.storage.get_snippet_content(entry.item_id)
         self.hide()
-        self.paste_callback(entry.content, source_id=entry.item_id, source_type=entry.kind)
+        self.paste_callback(content, source_id=entry.item_id, source_type=entry.kind)
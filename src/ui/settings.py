@@ -1,9 +1,47 @@
 """
 Settings dialog for Clipy Windows.
 """
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+# Cheap structural pre-check: '+'-joined tokens, each a key name (which
+# may contain spaces, e.g. 'page up') or a single punctuation character.
+# The keyboard library itself is the authority on which names are real.
+_HOTKEY_TOKEN = r"(?:[a-z0-9 ]+|[`~\-=\[\]\\;',./])"
+_HOTKEY_RE = re.compile(rf'^{_HOTKEY_TOKEN}(?:\+{_HOTKEY_TOKEN})*$')
+
+
+def _valid_hotkey(spec: str) -> bool:
+    """True if the keyboard library can bind this hotkey."""
+    if not _HOTKEY_RE.match(spec):
+        return False
+    try:
+        import keyboard
+        keyboard.parse_hotkey(spec)
+        return True
+    except ImportError:
+        # Library unavailable (e.g. dev box without hooks) — the
+        # structural check is the best we can do.
+        return True
+    except Exception:
+        return False
+
+# Shared font tuples — one object per font instead of a fresh tuple per widget
+_FONT8 = ('Segoe UI', 8)
+_FONT9 = ('Segoe UI', 9)
+_FONT9B = ('Segoe UI', 9, 'bold')
+_FONT10 = ('Segoe UI', 10)
+_FONT10B = ('Segoe UI', 10, 'bold')
+
+# Theme palettes, built once at import; picked by the settings key
+_THEMES = {
+    'dark':  dict(bg='#1e1e1e', fg='#eeeeee', entry_bg='#2d2d2d',
+                  btn_bg='#0078d4', btn_fg='#ffffff'),
+    'light': dict(bg='#f5f5f5', fg='#1a1a1a', entry_bg='#ffffff',
+                  btn_bg='#0078d4', btn_fg='#ffffff'),
+}
+
 
 class SettingsDialog(tk.Toplevel):
     def __init__(self, parent, storage, hotkey_manager):
@@ -12,16 +50,14 @@ class SettingsDialog(tk.Toplevel):
         self.hotkey_manager = hotkey_manager
         self.title('Clipy for Windows — Settings')
         self.resizable(False, False)
+        # transient + grab_set is the Tk modal idiom; -topmost on top of
+        # it only adds z-order churn on Windows
+        self.transient(parent)
         self.grab_set()
-        self.attributes('-topmost', True)
 
-        theme = storage.get_setting('theme', 'dark')
-        if theme == 'dark':
-            self.bg, self.fg, self.entry_bg = '#1e1e1e', '#eeeeee', '#2d2d2d'
-            self.btn_bg, self.btn_fg = '#0078d4', '#ffffff'
-        else:
-            self.bg, self.fg, self.entry_bg = '#f5f5f5', '#1a1a1a', '#ffffff'
-            self.btn_bg, self.btn_fg = '#0078d4', '#ffffff'
+        theme = _THEMES.get(storage.get_setting('theme', 'dark'), _THEMES['dark'])
+        self.bg, self.fg, self.entry_bg = theme['bg'], theme['fg'], theme['entry_bg']
+        self.btn_bg, self.btn_fg = theme['btn_bg'], theme['btn_fg']
 
         self.configure(bg=self.bg)
         self._build()
@@ -35,15 +71,29 @@ class SettingsDialog(tk.Toplevel):
 
     def _label(self, parent, text):
         tk.Label(parent, text=text, bg=self.bg, fg=self.fg,
-                 font=('Segoe UI', 10), anchor='w').pack(anchor='w', pady=(8, 2))
+                 font=_FONT10, anchor='w').pack(anchor='w', pady=(8, 2))
 
     def _entry(self, parent, var):
         e = tk.Entry(parent, textvariable=var, bg=self.entry_bg, fg=self.fg,
-                     insertbackground=self.fg, font=('Segoe UI', 10),
+                     insertbackground=self.fg, font=_FONT10,
                      relief=tk.FLAT, bd=4, width=32)
         e.pack(anchor='w', pady=(0, 4))
         return e
 
+    def _make_hotkey_cell(self, parent, col, label, key, default, color):
+        """One badge + entry cell in the hotkey grid."""
+        cell = tk.Frame(parent, bg=self.bg)
+        cell.grid(row=0, column=col, padx=(0, 12), sticky='w')
+        badge = tk.Frame(cell, bg=color)
+        badge.pack(anchor='w', pady=(0, 3))
+        tk.Label(badge, text=f'  {label}  ', bg=color, fg='#ffffff',
+                 font=_FONT9B).pack()
+        var = tk.StringVar(value=self.storage.get_setting(key, default))
+        setattr(self, f'_hk_{key}', var)
+        tk.Entry(cell, textvariable=var, bg=self.entry_bg, fg=self.fg,
+                 insertbackground=self.fg, font=_FONT10,
+                 relief=tk.FLAT, bd=4, width=16).pack()
+
     def _build(self):
         pad = dict(padx=20, pady=6)
         outer = tk.Frame(self, bg=self.bg)
@@ -63,20 +113,10 @@ class SettingsDialog(tk.Toplevel):
             ('Snippets Only',       'hotkey_snippets', 'ctrl+shift+s', '#8764b8'),
             ('Snippet Editor',      'hotkey_editor',   'ctrl+shift+e', '#c8512b'),
         ]):
-            cell = tk.Frame(hk_frame, bg=self.bg)
-            cell.grid(row=0, column=col, padx=(0, 12), sticky='w')
-            badge = tk.Frame(cell, bg=color)
-            badge.pack(anchor='w', pady=(0, 3))
-            tk.Label(badge, text=f'  {label}  ', bg=color, fg='#ffffff',
-                     font=('Segoe UI', 9, 'bold')).pack()
-            var = tk.StringVar(value=self.storage.get_setting(key, default))
-            setattr(self, f'_hk_{key}', var)
-            tk.Entry(cell, textvariable=var, bg=self.entry_bg, fg=self.fg,
-                     insertbackground=self.fg, font=('Segoe UI', 10),
-                     relief=tk.FLAT, bd=4, width=16).pack()
+            self._make_hotkey_cell(hk_frame, col, label, key, default, color)
 
         tk.Label(outer, text='Example: ctrl+shift+v  /  alt+v  /  ctrl+`  　Empty=disabled',
-                 bg=self.bg, fg='#888888', font=('Segoe UI', 8)).pack(anchor='w', pady=(4, 0))
+                 bg=self.bg, fg='#888888', font=_FONT8).pack(anchor='w', pady=(4, 0))
 
         # ── Max history ──────────────────────────────────────────────────
         self._label(outer, 'Max history count:')
@@ -92,7 +132,7 @@ class SettingsDialog(tk.Toplevel):
             tk.Radiobutton(rf, text=text, variable=self._theme_var, value=val,
                            bg=self.bg, fg=self.fg, selectcolor=self.bg,
                            activebackground=self.bg, activeforeground=self.fg,
-                           font=('Segoe UI', 10)).pack(side=tk.LEFT, padx=(0, 12))
+                           font=_FONT10).pack(side=tk.LEFT, padx=(0, 12))
 
         # ── Start with Windows ───────────────────────────────────────────
         self._startup_var = tk.BooleanVar(
@@ -103,17 +143,17 @@ class SettingsDialog(tk.Toplevel):
             variable=self._startup_var,
             bg=self.bg, fg=self.fg, selectcolor=self.bg,
             activebackground=self.bg, activeforeground=self.fg,
-            font=('Segoe UI', 10),
+            font=_FONT10,
         ).pack(anchor='w', pady=(8, 0))
 
         # ── Usage counts ─────────────────────────────────────────────────
         uf = tk.Frame(outer, bg=self.bg)
         uf.pack(anchor='w', pady=(10, 0), fill=tk.X)
         tk.Label(uf, text='Snippet usage counts (used for folder ordering):',
-                 bg=self.bg, fg=self.fg, font=('Segoe UI', 10)).pack(anchor='w')
+                 bg=self.bg, fg=self.fg, font=_FONT10).pack(anchor='w')
         tk.Button(uf, text='Reset Usage Counts', command=self._reset_usage,
                   bg=self.entry_bg, fg=self.fg, relief=tk.FLAT,
-                  padx=10, pady=4, font=('Segoe UI', 9),
+                  padx=10, pady=4, font=_FONT9,
                   cursor='hand2').pack(anchor='w', pady=(4, 0))
 
         # ── Buttons ──────────────────────────────────────────────────────
@@ -121,13 +161,16 @@ class SettingsDialog(tk.Toplevel):
                  height=1).pack(fill=tk.X, pady=(16, 8))
         bf = tk.Frame(outer, bg=self.bg)
         bf.pack(anchor='e')
+        # Inline save confirmation — shown briefly instead of a modal box
+        self._status_label = tk.Label(bf, text='', bg=self.bg, fg='#2ea043',
+                                      font=_FONT9B)
         tk.Button(bf, text='Cancel', command=self.destroy,
                   bg=self.entry_bg, fg=self.fg, relief=tk.FLAT,
-                  padx=14, pady=6, font=('Segoe UI', 10),
+                  padx=14, pady=6, font=_FONT10,
                   cursor='hand2').pack(side=tk.LEFT, padx=(0, 8))
         tk.Button(bf, text='Save', command=self._save,
                   bg=self.btn_bg, fg=self.btn_fg, relief=tk.FLAT,
-                  padx=14, pady=6, font=('Segoe UI', 10, 'bold'),
+                  padx=14, pady=6, font=_FONT10B,
                   cursor='hand2').pack(side=tk.LEFT)
 
     def _reset_usage(self):
@@ -143,16 +186,22 @@ class SettingsDialog(tk.Toplevel):
             messagebox.showerror('Error', 'Max history count must be an integer between 1 and 10000.', parent=self)
             return
 
-        # At least one hotkey must be set
-        hk_main     = getattr(self, '_hk_hotkey_main',     None)
-        hk_history  = getattr(self, '_hk_hotkey_history',  None)
-        hk_snippets = getattr(self, '_hk_hotkey_snippets', None)
-
-        # Save all three hotkeys (empty string = disabled)
+        # Validate every hotkey before anything is written, so a typo
+        # can't leave half the settings saved (empty string = disabled)
+        hotkeys = {}
         for key in ('hotkey_main', 'hotkey_history', 'hotkey_snippets', 'hotkey_editor'):
             var = getattr(self, f'_hk_{key}', None)
-            if var is not None:
-                self.storage.set_setting(key, var.get().strip().lower())
+            if var is None:
+                continue
+            s = var.get().strip().lower()
+            if s and not _valid_hotkey(s):
+                messagebox.showerror(
+                    'Error', f'Invalid hotkey: {s}\nExample: ctrl+shift+v',
+                    parent=self)
+                return
+            hotkeys[key] = s
+        for key, s in hotkeys.items():
+            self.storage.set_setting(key, s)
 
         self.storage.set_setting('max_history', str(n))
         self.storage.set_setting('theme', self._theme_var.get())
@@ -160,5 +209,8 @@ class SettingsDialog(tk.Toplevel):
         self.storage.set_setting('start_with_windows', 'true' if startup else 'false')
         self.storage.apply_startup(startup)
         self.hotkey_manager.reload()
-        messagebox.showinfo('Saved', 'Settings saved successfully.\nTheme changes will take effect on next popup display.', parent=self)
-        self.destroy()
+        # Brief inline confirmation (same pattern as the snippet editor's
+        # mode label) instead of a blocking message box
+        self._status_label.configure(text='✓ Saved')
+        self._status_label.pack(side=tk.LEFT, padx=(0, 10))
+        self.after(800, self.destroy)
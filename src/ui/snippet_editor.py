@@ -2,9 +2,66 @@
 Snippet manager dialog.
 Lets users create/edit/delete snippets and folders.
 """
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 
+# Theme palettes, built once at import; dialogs pick by settings key
+_THEMES = {
+    'dark': dict(
+        bg='#1e1e1e', fg='#eeeeee',
+        panel='#252525', item_bg='#2a2a2a',
+        select='#0078d4', select_fg='#ffffff',
+        border='#3a3a3a', btn='#333333',
+        text_bg='#2d2d2d', muted='#888888',
+        new_badge='#1a5fa8', edit_badge='#1a7a4a',
+    ),
+    'light': dict(
+        bg='#f5f5f5', fg='#1a1a1a',
+        panel='#ffffff', item_bg='#efefef',
+        select='#0078d4', select_fg='#ffffff',
+        border='#c8c8c8', btn='#d8d8d8',
+        text_bg='#ffffff', muted='#555555',
+        new_badge='#0078d4', edit_badge='#107c10',
+    ),
+}
+
+
+# ttk.Style state is process-global, so configure the editor styles once
+# per palette and let repeat opens skip the Tcl calls
+_styled_with = None
+
+
+def _ensure_styles(widget, C):
+    global _styled_with
+    if C is _styled_with:
+        return
+    style = ttk.Style(widget)
+    style.theme_use('default')
+    # Treeview draws only the visible rows, unlike Listbox which
+    # repaints the whole list — matters once snippets number thousands
+    style.configure('Editor.Treeview',
+        background=C['panel'], fieldbackground=C['panel'],
+        foreground=C['fg'], borderwidth=0,
+        font=('Segoe UI', 10), rowheight=24,
+    )
+    style.map('Editor.Treeview',
+        background=[('selected', C['select'])],
+        foreground=[('selected', C['select_fg'])],
+    )
+    style.configure('Folder.TCombobox',
+        fieldbackground=C['text_bg'], background=C['btn'],
+        foreground=C['fg'], selectbackground=C['text_bg'],
+        selectforeground=C['fg'], arrowcolor=C['fg'],
+    )
+    style.map('Folder.TCombobox',
+        fieldbackground=[('readonly', C['text_bg'])],
+        selectbackground=[('readonly', C['text_bg'])],
+        selectforeground=[('readonly', C['fg'])],
+    )
+    _styled_with = C
+
 
 class SnippetEditor(tk.Toplevel):
     def __init__(self, parent, storage):
@@ -13,39 +70,39 @@ class SnippetEditor(tk.Toplevel):
         self.title('Clipy for Windows — Snippet Manager')
         self.geometry('760x620')
         self.minsize(640, 520)
+        # transient keeps the dialog above its (hidden) parent without
+        # the z-order churn -topmost causes on Windows; grab_set already
+        # makes it modal
+        self.transient(parent)
         self.grab_set()
-        self.attributes('-topmost', True)
 
         theme = storage.get_setting('theme', 'dark')
-        if theme == 'dark':
-            self.C = dict(
-                bg='#1e1e1e', fg='#eeeeee',
-                panel='#252525', item_bg='#2a2a2a',
-                select='#0078d4', select_fg='#ffffff',
-                border='#3a3a3a', btn='#333333',
-                text_bg='#2d2d2d', muted='#888888',
-                new_badge='#1a5fa8', edit_badge='#1a7a4a',
-            )
-        else:
-            self.C = dict(
-                bg='#f5f5f5', fg='#1a1a1a',
-                panel='#ffffff', item_bg='#efefef',
-                select='#0078d4', select_fg='#ffffff',
-                border='#c8c8c8', btn='#d8d8d8',
-                text_bg='#ffffff', muted='#555555',
-                new_badge='#0078d4', edit_badge='#107c10',
-            )
-
+        self.C = _THEMES.get(theme, _THEMES['dark'])
         self.configure(bg=self.C['bg'])
         self._current_folder: int | None = None
         self._editing_snip: int | None = None
-        self._folder_ids: list = []
-        self._snip_ids: list = []
         self._combo_folder_ids: list = []
+        self._combo_folder_index: dict = {}
+        self._snip_cache: dict = {}
+        self._select_after_id = None
+        self._loaded_snip_id = None
+        # Import/export run on a worker thread; results come back here
+        self._io_q: queue.Queue = queue.Queue()
+        # Suppresses <<TreeviewSelect>> handlers while we move the
+        # selection programmatically (Treeview fires the event either way)
+        self._syncing = False
         self._build()
+        self._center()
+        # Paint the empty shell first and fill the lists once Tk goes
+        # idle, so the window appears instantly even with a big library
+        # (_center's update_idletasks would run after_idle callbacks, so
+        # it has to come before the deferral)
+        self._snip_lb.insert('', tk.END, iid='loading', text=' Loading…')
+        self.after_idle(self._populate)
+
+    def _populate(self):
         self._refresh()
         self._set_new_mode()
-        self._center()
 
     def _center(self):
         self.update_idletasks()
@@ -57,6 +114,8 @@ class SnippetEditor(tk.Toplevel):
 
     def _build(self):
         C = self.C
+        _ensure_styles(self, C)
+
         main = tk.Frame(self, bg=C['bg'])
         main.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
@@ -69,13 +128,11 @@ class SnippetEditor(tk.Toplevel):
                  font=('Segoe UI', 10, 'bold'), anchor='w', padx=8, pady=6).pack(fill=tk.X)
         tk.Frame(left, bg=C['border'], height=1).pack(fill=tk.X)
 
-        self._folder_lb = tk.Listbox(
-            left, bg=C['panel'], fg=C['fg'],
-            selectbackground=C['select'], selectforeground=C['select_fg'],
-            font=('Segoe UI', 10), relief=tk.FLAT, bd=0, activestyle='none',
+        self._folder_lb = ttk.Treeview(
+            left, show='tree', selectmode='browse', style='Editor.Treeview',
         )
         self._folder_lb.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-        self._folder_lb.bind('<<ListboxSelect>>', self._on_folder_select)
+        self._folder_lb.bind('<<TreeviewSelect>>', self._on_folder_select)
 
         fb = tk.Frame(left, bg=C['panel'])
         fb.pack(fill=tk.X, pady=4, padx=4)
@@ -136,13 +193,11 @@ class SnippetEditor(tk.Toplevel):
                  font=('Segoe UI', 10, 'bold'), anchor='w', padx=8, pady=5).pack(fill=tk.X)
         tk.Frame(list_frame, bg=C['border'], height=1).pack(fill=tk.X)
 
-        self._snip_lb = tk.Listbox(
-            list_frame, bg=C['panel'], fg=C['fg'],
-            selectbackground=C['select'], selectforeground=C['select_fg'],
-            font=('Segoe UI', 10), relief=tk.FLAT, bd=0, activestyle='none',
+        self._snip_lb = ttk.Treeview(
+            list_frame, show='tree', selectmode='browse', style='Editor.Treeview',
         )
         self._snip_lb.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-        self._snip_lb.bind('<<ListboxSelect>>', self._on_snip_select)
+        self._snip_lb.bind('<<TreeviewSelect>>', self._on_snip_select)
 
         # ── Bottom pane: editor form ──────────────────────────────────────
         bot_pane = tk.Frame(paned, bg=C['bg'])
@@ -163,18 +218,6 @@ class SnippetEditor(tk.Toplevel):
         self._mode_label.pack(side=tk.LEFT, padx=(6, 0))
 
         # Folder selector
-        style = ttk.Style(self)
-        style.theme_use('default')
-        style.configure('Folder.TCombobox',
-            fieldbackground=C['text_bg'], background=C['btn'],
-            foreground=C['fg'], selectbackground=C['text_bg'],
-            selectforeground=C['fg'], arrowcolor=C['fg'],
-        )
-        style.map('Folder.TCombobox',
-            fieldbackground=[('readonly', C['text_bg'])],
-            selectbackground=[('readonly', C['text_bg'])],
-            selectforeground=[('readonly', C['fg'])],
-        )
         folder_row = tk.Frame(bot_pane, bg=C['bg'])
         folder_row.pack(fill=tk.X, padx=2, pady=(0, 5))
         tk.Label(folder_row, text='Folder:', bg=C['bg'], fg=C['fg'],
@@ -216,12 +259,13 @@ class SnippetEditor(tk.Toplevel):
         """Switch editor to 'create new' state."""
         C = self.C
         self._editing_snip = None
+        self._loaded_snip_id = None
         self._mode_badge.configure(text=' NEW ', bg=C['new_badge'])
         self._mode_label.configure(text='Create a new snippet')
         self._save_btn.configure(text='+ Add')
         self._title_var.set('')
         self._content_txt.delete('1.0', tk.END)
-        self._snip_lb.selection_clear(0, tk.END)
+        self._snip_lb.selection_set(())
         self._set_combo_folder(self._current_folder)
         self._title_entry.focus_set()
 
@@ -235,64 +279,95 @@ class SnippetEditor(tk.Toplevel):
 
     # ── Data ──────────────────────────────────────────────────────────────
 
-    def _refresh_folder_combo(self):
-        folders = self.storage.get_folders()
+    def _refresh_folder_combo(self, folders):
         self._combo_folder_ids = [None] + [f['id'] for f in folders]
+        # Reverse map so id → combobox position is a dict hit, not a scan
+        self._combo_folder_index = {
+            fid: i for i, fid in enumerate(self._combo_folder_ids)
+        }
         self._folder_combo['values'] = ['(No folder)'] + [f['name'] for f in folders]
 
     def _set_combo_folder(self, folder_id):
-        try:
-            idx = self._combo_folder_ids.index(folder_id)
-        except ValueError:
-            idx = 0
-        self._folder_combo.current(idx)
+        self._folder_combo.current(self._combo_folder_index.get(folder_id, 0))
 
     def _refresh(self):
-        self._folder_lb.delete(0, tk.END)
-        self._folder_ids = [None]
-        self._folder_lb.insert(tk.END, '  All')
-        for folder in self.storage.get_folders():
-            self._folder_lb.insert(tk.END, f'  {folder["name"]}')
-            self._folder_ids.append(folder['id'])
-        self._folder_lb.selection_set(0)
-        self._refresh_folder_combo()
+        # One folder query feeds both the tree and the combobox
+        folders = self.storage.get_folders()
+        tree = self._folder_lb
+        tree.delete(*tree.get_children())
+        # Row ids double as database ids ('all' = no folder filter), so
+        # selection handlers read them straight off the iid
+        tree.insert('', tk.END, iid='all', text=' All')
+        for f in folders:
+            tree.insert('', tk.END, iid=str(f['id']), text=f' {f["name"]}')
+        self._syncing = True
+        try:
+            tree.selection_set('all')
+        finally:
+            self._syncing = False
+        self._refresh_folder_combo(folders)
         self._load_snippets(None)
 
     def _load_snippets(self, folder_id):
-        self._snip_lb.delete(0, tk.END)
-        self._snip_ids = []
         snips = (
             self.storage.get_all_snippets()
             if folder_id is None
             else self.storage.get_snippets(folder_id=folder_id)
         )
-        for s in snips:
-            self._snip_lb.insert(tk.END, f'  {s["title"]}')
-            self._snip_ids.append(s['id'])
+        # The rows already carry title/content/folder_id, so keep them —
+        # selecting a snippet then needs no further SQL
+        self._snip_cache = {s['id']: s for s in snips}
+        tree = self._snip_lb
+        # Unmap while repopulating so the hundreds of inserts cost one
+        # relayout at the end instead of redraw work per row (it is the
+        # last packed child of its frame, so re-packing keeps the layout)
+        tree.pack_forget()
+        try:
+            tree.delete(*tree.get_children())
+            for s in snips:
+                tree.insert('', tk.END, iid=str(s['id']), text=f' {s["title"]}')
+        finally:
+            tree.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
 
     def _on_folder_select(self, _event=None):
-        sel = self._folder_lb.curselection()
+        if self._syncing:
+            return
+        sel = self._folder_lb.selection()
         if not sel:
             return
-        self._current_folder = self._folder_ids[sel[0]]
+        self._current_folder = None if sel[0] == 'all' else int(sel[0])
         self._load_snippets(self._current_folder)
         self._set_new_mode()
 
     def _on_snip_select(self, _event=None):
-        sel = self._snip_lb.curselection()
-        if not sel:
+        if self._syncing:
             return
-        snip_id = self._snip_ids[sel[0]]
+        sel = self._snip_lb.selection()
+        if not sel or not sel[0].isdigit():   # ignore the Loading… placeholder
+            return
+        # Debounce: holding an arrow key fires one event per repeat, but
+        # only the selection the user lands on needs to fill the editor
+        if self._select_after_id is not None:
+            self.after_cancel(self._select_after_id)
+        self._select_after_id = self.after(30, self._do_snip_select, int(sel[0]))
+
+    def _do_snip_select(self, snip_id):
+        self._select_after_id = None
+        if snip_id == self._loaded_snip_id:
+            return   # re-selection of what's already displayed
         self._editing_snip = snip_id
-        row = self.storage._conn.execute(
-            'SELECT title, content, folder_id FROM snippets WHERE id=?', (snip_id,)
-        ).fetchone()
+        row = self._snip_cache.get(snip_id)
+        if row is None:
+            # Cache miss (shouldn't happen in practice) — one cached-
+            # statement lookup through the storage API
+            row = self.storage.get_snippet(snip_id)
         if row:
             self._title_var.set(row['title'])
-            self._content_txt.delete('1.0', tk.END)
-            self._content_txt.insert('1.0', row['content'])
+            # replace() is one Tcl call for delete+insert
+            self._content_txt.replace('1.0', tk.END, row['content'])
             self._set_combo_folder(row['folder_id'])
             self._set_edit_mode(row['title'])
+            self._loaded_snip_id = snip_id
 
     # ── Actions ───────────────────────────────────────────────────────────
 
@@ -303,7 +378,7 @@ class SnippetEditor(tk.Toplevel):
           - If form is empty → just switch to new mode (clear form & focus)
         """
         title = self._title_var.get().strip()
-        content = self._content_txt.get('1.0', tk.END).rstrip('\n')
+        content = self._content_txt.get('1.0', 'end-1c')
 
         if title and content:
             # If filled, save then clear
@@ -327,34 +402,47 @@ class SnippetEditor(tk.Toplevel):
     def _add_folder(self):
         name = simpledialog.askstring('Add Folder', 'Enter folder name:', parent=self)
         if name and name.strip():
-            self.storage.add_folder(name.strip())
-            self._refresh()
+            name = name.strip()
+            # Apply the delta instead of rebuilding both lists — the new
+            # folder goes to the end until the next full refresh re-sorts
+            fid = self.storage.add_folder(name)
+            self._folder_lb.insert('', tk.END, iid=str(fid), text=f' {name}')
+            self._combo_folder_index[fid] = len(self._combo_folder_ids)
+            self._combo_folder_ids.append(fid)
+            self._folder_combo['values'] = (*self._folder_combo['values'], name)
 
     def _rename_folder(self):
-        sel = self._folder_lb.curselection()
-        if not sel or sel[0] == 0:
+        sel = self._folder_lb.selection()
+        if not sel or sel[0] == 'all':
             messagebox.showinfo('Info', 'Please select a folder to rename.', parent=self)
             return
-        folder_id = self._folder_ids[sel[0]]
-        current_name = self._folder_lb.get(sel[0]).strip()
+        folder_id = int(sel[0])
+        current_name = self._folder_lb.item(sel[0], 'text').strip()
         new_name = simpledialog.askstring(
             'Rename Folder', 'Enter new folder name:',
             initialvalue=current_name, parent=self,
         )
         if new_name and new_name.strip() and new_name.strip() != current_name:
-            self.storage.update_folder(folder_id, new_name.strip())
-            self._refresh()
-            # Re-select the renamed folder
-            if folder_id in self._folder_ids:
-                idx = self._folder_ids.index(folder_id)
-                self._folder_lb.selection_set(idx)
+            new_name = new_name.strip()
+            self.storage.update_folder(folder_id, new_name)
+            # Retitle the row and combobox entry in place; the snippet
+            # list is untouched by a rename
+            self._folder_lb.item(sel[0], text=f' {new_name}')
+            pos = self._combo_folder_index.get(folder_id)
+            if pos is None:
+                return
+            values = list(self._folder_combo['values'])
+            values[pos] = new_name
+            self._folder_combo['values'] = values
+            if self._folder_combo.current() == pos:
+                self._folder_combo.current(pos)   # refresh displayed text
 
     def _del_folder(self):
-        sel = self._folder_lb.curselection()
-        if not sel or sel[0] == 0:
+        sel = self._folder_lb.selection()
+        if not sel or sel[0] == 'all':
             messagebox.showinfo('Info', 'Please select a folder to delete.', parent=self)
             return
-        folder_id = self._folder_ids[sel[0]]
+        folder_id = int(sel[0])
         if messagebox.askyesno('Confirm', 'Delete this folder and all its snippets?', parent=self):
             self.storage.delete_folder(folder_id)
             self._refresh()
@@ -373,88 +461,109 @@ class SnippetEditor(tk.Toplevel):
 
     def _export_snippets(self):
         """Export all snippets to XML plist file (Clipy macOS compatible)."""
+        file_path = filedialog.asksaveasfilename(
+            parent=self,
+            title='Export Snippets',
+            defaultextension='.xml',
+            filetypes=[
+                ('XML Plist Files', '*.xml'),
+                ('Plist Files', '*.plist'),
+                ('All Files', '*.*')
+            ],
+            initialfile='clipy_snippets.xml'
+        )
+        if not file_path:
+            return
+        self._start_io(self._do_export, file_path)
+
+    def _do_export(self, file_path):
+        """Worker-thread body: serialize and write, no Tk access."""
         try:
-            file_path = filedialog.asksaveasfilename(
-                parent=self,
-                title='Export Snippets',
-                defaultextension='.xml',
-                filetypes=[
-                    ('XML Plist Files', '*.xml'),
-                    ('Plist Files', '*.plist'),
-                    ('All Files', '*.*')
-                ],
-                initialfile='clipy_snippets.xml'
-            )
-            
-            if not file_path:
-                return
-            
-            xml_content = self.storage.export_snippets_xml()
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
-            
-            messagebox.showinfo(
-                'Export Successful',
-                f'Snippets exported successfully to:\n{file_path}',
-                parent=self
-            )
+            # Stream folder-by-folder; a big buffer keeps writes chunky
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self.storage.export_snippets_xml_to(f)
+            self._io_q.put(('export_done', file_path))
         except Exception as e:
-            messagebox.showerror(
-                'Export Failed',
-                f'Failed to export snippets:\n{str(e)}',
-                parent=self
-            )
+            self._io_q.put(('export_err', str(e)))
 
     def _import_snippets(self):
         """Import snippets from XML plist file (Clipy macOS compatible)."""
+        file_path = filedialog.askopenfilename(
+            parent=self,
+            title='Import Snippets',
+            filetypes=[
+                ('XML Plist Files', '*.xml'),
+                ('Plist Files', '*.plist'),
+                ('All Files', '*.*')
+            ]
+        )
+        if not file_path:
+            return
+
+        # Ask if user wants to merge or replace
+        merge = messagebox.askyesno(
+            'Import Mode',
+            'Do you want to merge with existing snippets?\n\n'
+            'Yes: Keep existing snippets and add imported ones\n'
+            'No: Replace all existing snippets with imported ones',
+            parent=self
+        )
+        self._start_io(self._do_import, file_path, merge)
+
+    def _do_import(self, file_path, merge):
+        """Worker-thread body: read, parse and insert, no Tk access."""
         try:
-            file_path = filedialog.askopenfilename(
-                parent=self,
-                title='Import Snippets',
-                filetypes=[
-                    ('XML Plist Files', '*.xml'),
-                    ('Plist Files', '*.plist'),
-                    ('All Files', '*.*')
-                ]
-            )
-            
-            if not file_path:
-                return
-            
-            # Ask if user wants to merge or replace
-            merge = messagebox.askyesno(
-                'Import Mode',
-                'Do you want to merge with existing snippets?\n\n'
-                'Yes: Keep existing snippets and add imported ones\n'
-                'No: Replace all existing snippets with imported ones',
-                parent=self
-            )
-            
             with open(file_path, 'r', encoding='utf-8') as f:
                 xml_content = f.read()
-            
             self.storage.import_snippets_xml(xml_content, merge=merge)
-            
-            # Refresh the UI
+            self._io_q.put(('import_done', file_path))
+        except Exception as e:
+            self._io_q.put(('import_err', str(e)))
+
+    def _start_io(self, target, *args):
+        """Run a file operation on a worker thread and poll for its result,
+        so multi-MB imports don't freeze the dialog."""
+        threading.Thread(target=target, args=args, daemon=True, name='SnippetIO').start()
+        self.after(50, self._poll_io_q)
+
+    def _poll_io_q(self):
+        if not self.winfo_exists():
+            return
+        try:
+            kind, payload = self._io_q.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_io_q)
+            return
+        if kind == 'export_done':
+            messagebox.showinfo(
+                'Export Successful',
+                f'Snippets exported successfully to:\n{payload}',
+                parent=self
+            )
+        elif kind == 'import_done':
             self._refresh()
             self._set_new_mode()
-            
             messagebox.showinfo(
                 'Import Successful',
-                f'Snippets imported successfully from:\n{file_path}',
+                f'Snippets imported successfully from:\n{payload}',
                 parent=self
             )
-        except Exception as e:
+        elif kind == 'export_err':
+            messagebox.showerror(
+                'Export Failed',
+                f'Failed to export snippets:\n{payload}',
+                parent=self
+            )
+        else:
             messagebox.showerror(
                 'Import Failed',
-                f'Failed to import snippets:\n{str(e)}',
+                f'Failed to import snippets:\n{payload}',
                 parent=self
             )
 
     def _save_snippet(self):
         title = self._title_var.get().strip()
-        content = self._content_txt.get('1.0', tk.END).rstrip('\n')
+        content = self._content_txt.get('1.0', 'end-1c')
 
         if not title:
             messagebox.showerror('Input Error', 'Please enter a title.', parent=self)
@@ -480,12 +589,17 @@ class SnippetEditor(tk.Toplevel):
 
         self._load_snippets(self._current_folder)
 
-        # Re-select the saved snippet in the listbox
-        if self._editing_snip in self._snip_ids:
-            idx = self._snip_ids.index(self._editing_snip)
-            self._snip_lb.selection_set(idx)
-            self._snip_lb.see(idx)
+        # Re-select the saved snippet in the list
+        iid = str(self._editing_snip)
+        if self._snip_lb.exists(iid):
+            self._syncing = True
+            try:
+                self._snip_lb.selection_set(iid)
+                self._snip_lb.see(iid)
+            finally:
+                self._syncing = False
             self._set_edit_mode(title)
+            self._loaded_snip_id = self._editing_snip
 
         # Show brief status in mode label instead of blocking dialog
         self._mode_label.configure(text=f'✓  {msg}')
@@ -1,71 +1,283 @@
 """
 System tray icon for Clipy Windows.
+
+Preferred mode: a small win32gui wrapper around Shell_NotifyIcon — one
+hidden window, one message pump, no per-menu-item Python trampolines.
+Falls back to pystray when pywin32 is unavailable or setup fails.
 """
+import functools
+import os
+import tempfile
+from pathlib import Path
+
 import pystray
 from PIL import Image, ImageDraw
 
+WM_TRAYICON = 0x0400 + 20   # WM_USER + 20: tray callback message
+
+_RESOURCES = Path(__file__).resolve().parents[2] / 'resources'
+
 
+@functools.lru_cache(maxsize=4)
+def _load_icon(size: int = 64) -> Image.Image:
+    """
+    Tray icon image: the pre-baked PNG asset when present (one decode,
+    no drawing), otherwise drawn on the fly by _make_icon. Either way
+    the result is cached per size.
+    """
+    try:
+        img = Image.open(_RESOURCES / f'tray_icon_{size}.png')
+        img.load()
+    except Exception:
+        img = _make_icon(size)
+    # The glyph uses a handful of colours, so palette mode carries the
+    # same pixels (alpha included) at 1 byte each instead of 4
+    try:
+        return img.quantize(colors=64)
+    except Exception:
+        return img
+
+
+# The icon is deterministic, so draw it once per size and reuse the same
+# Image across tray restarts. Kept as the fallback renderer and as the
+# generator for the checked-in asset.
+@functools.lru_cache(maxsize=4)
 def _make_icon(size: int = 64) -> Image.Image:
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     d = ImageDraw.Draw(img)
 
+    # Shared geometry — every size // N computed once up front
+    eighth = size // 8
+    sixth = size // 6
+    margin = eighth
+    clip_h = eighth
+    body_top = sixth
+    r_body = size // 12
+    r_clip = size // 14
+
     # Clipboard body
-    margin = size // 8
-    clip_h = size // 8
-    body_top = size // 6
     d.rounded_rectangle(
         [margin, body_top, size - margin, size - margin],
-        radius=size // 12,
+        radius=r_body,
         fill='#4A90E2',
     )
 
     # Clip (top bar)
-    clip_w = size // 3
+    half_clip_w = sixth   # (size // 3) // 2
     cx = size // 2
     d.rounded_rectangle(
-        [cx - clip_w // 2, margin - clip_h // 2, cx + clip_w // 2, body_top + clip_h // 2],
-        radius=size // 14,
+        [cx - half_clip_w, margin - clip_h // 2, cx + half_clip_w, body_top + clip_h // 2],
+        radius=r_clip,
         fill='#1a5fa8',
     )
 
-    # Lines representing text
-    lm = margin + size // 8
-    rm = size - margin - size // 8
-    line_color = 'white'
+    # Lines representing text — all four rects computed up front, the
+    # loop only feeds coordinates to the fill
+    lm = margin + eighth
+    rm = size - lm
     line_h = max(2, size // 20)
-    for row, (x2, y_off) in enumerate([(rm, 0), (rm - size // 8, 1), (rm, 2), (rm - size // 6, 3)]):
-        y = body_top + size // 5 + row * (line_h + size // 14)
-        d.rectangle([lm, y, x2, y + line_h], fill=line_color)
+    y0 = body_top + size // 5
+    step = line_h + r_clip
+    rects = [
+        (lm, y0,            rm,          y0 + line_h),
+        (lm, y0 + step,     rm - eighth, y0 + step + line_h),
+        (lm, y0 + 2 * step, rm,          y0 + 2 * step + line_h),
+        (lm, y0 + 3 * step, rm - sixth,  y0 + 3 * step + line_h),
+    ]
+    for rect in rects:
+        d.rectangle(rect, fill='white')
 
     return img
 
 
 class TrayIcon:
+    # (menu id, label, handler attr); None is a separator, handler None
+    # renders the entry disabled. Ids are offsets from _CMD_BASE.
+    _MENU_ITEMS = (
+        (0, 'Clipy for Windows', None),
+        None,
+        (1, 'Show Clipboard History', '_show_popup'),
+        (2, 'Snippet Manager', '_open_snippets'),
+        None,
+        (3, 'Settings', '_open_settings'),
+        None,
+        (4, 'Clear History', '_clear_history'),
+        None,
+        (5, 'Quit', '_quit'),
+    )
+    _CMD_BASE = 1023
+    _DEFAULT_CMD = 1   # double-click action: show history
+
     def __init__(self, app):
         self.app = app
         self._icon: pystray.Icon | None = None
+        self._hwnd = None
+        self._menu = None   # native HMENU, created on first use
 
     def run(self):
-        img = _make_icon()
-        menu = pystray.Menu(
-            pystray.MenuItem('Clipy for Windows', None, enabled=False),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem('Show Clipboard History', self._show_popup, default=True),
-            pystray.MenuItem('Snippet Manager', self._open_snippets),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem('Settings', self._open_settings),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem('Clear History', self._clear_history),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem('Quit', self._quit),
-        )
-        self._icon = pystray.Icon('Clipy', img, 'Clipy for Windows', menu=menu)
-        self._icon.run()
+        if not self._run_native():
+            self._run_pystray()
 
     def stop(self):
-        if self._icon:
+        if self._hwnd:
+            try:
+                import win32con
+                import win32gui
+                win32gui.PostMessage(self._hwnd, win32con.WM_CLOSE, 0, 0)
+            except Exception:
+                pass
+        elif self._icon:
             self._icon.stop()
 
+    # ── Native Shell_NotifyIcon tray ──────────────────────────────────────
+
+    def _run_native(self) -> bool:
+        """Register the icon via Shell_NotifyIcon and pump messages on
+        this thread. Returns False if the native path can't be set up."""
+        try:
+            import win32con
+            import win32gui
+
+            wc = win32gui.WNDCLASS()
+            wc.lpszClassName = 'ClipyTray'
+            wc.hInstance = win32gui.GetModuleHandle(None)
+            wc.lpfnWndProc = {
+                WM_TRAYICON: self._on_tray_notify,
+                win32con.WM_COMMAND: self._on_command,
+                win32con.WM_DESTROY: self._on_destroy,
+            }
+            atom = win32gui.RegisterClass(wc)
+            self._hwnd = win32gui.CreateWindow(
+                atom, 'ClipyTray', 0, 0, 0, 0, 0, 0, 0, wc.hInstance, None
+            )
+            flags = win32gui.NIF_ICON | win32gui.NIF_MESSAGE | win32gui.NIF_TIP
+            win32gui.Shell_NotifyIcon(win32gui.NIM_ADD, (
+                self._hwnd, 0, flags, WM_TRAYICON,
+                self._native_hicon(), 'Clipy for Windows',
+            ))
+        except Exception as e:
+            print(f'[Clipy] native tray unavailable ({e}), using pystray')
+            self._hwnd = None
+            return False
+        win32gui.PumpMessages()
+        return True
+
+    @staticmethod
+    def _native_hicon():
+        """HICON for the tray: the cached image, round-tripped through a
+        temporary .ico (LoadImage copies it, so the file can go)."""
+        import win32con
+        import win32gui
+        fd, path = tempfile.mkstemp(suffix='.ico')
+        os.close(fd)
+        try:
+            _load_icon(32).save(path, 'ICO')
+            return win32gui.LoadImage(
+                0, path, win32con.IMAGE_ICON, 0, 0,
+                win32con.LR_LOADFROMFILE | win32con.LR_DEFAULTSIZE,
+            )
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def _on_tray_notify(self, hwnd, msg, wparam, lparam):
+        import win32con
+        if lparam == win32con.WM_RBUTTONUP:
+            self._show_menu()
+        elif lparam == win32con.WM_LBUTTONDBLCLK:
+            self._dispatch(self._CMD_BASE + self._DEFAULT_CMD)
+        return 0
+
+    def _ensure_menu(self):
+        """Build the popup HMENU once; TrackPopupMenu can reuse it."""
+        import win32con
+        import win32gui
+        if self._menu is not None:
+            return self._menu
+        menu = win32gui.CreatePopupMenu()
+        for item in self._MENU_ITEMS:
+            if item is None:
+                win32gui.AppendMenu(menu, win32con.MF_SEPARATOR, 0, '')
+                continue
+            cmd, label, handler = item
+            flags = win32con.MF_STRING
+            if handler is None:
+                flags |= win32con.MF_GRAYED
+            win32gui.AppendMenu(menu, flags, self._CMD_BASE + cmd, label)
+        win32gui.SetMenuDefaultItem(menu, self._CMD_BASE + self._DEFAULT_CMD, False)
+        self._menu = menu
+        return menu
+
+    def _show_menu(self):
+        import win32con
+        import win32gui
+        menu = self._ensure_menu()
+        x, y = win32gui.GetCursorPos()
+        # Foreground focus is required or the menu won't dismiss on
+        # outside clicks (classic Shell_NotifyIcon quirk)
+        win32gui.SetForegroundWindow(self._hwnd)
+        win32gui.TrackPopupMenu(
+            menu, win32con.TPM_LEFTALIGN | win32con.TPM_RIGHTBUTTON,
+            x, y, 0, self._hwnd, None,
+        )
+        win32gui.PostMessage(self._hwnd, win32con.WM_NULL, 0, 0)
+
+    def _on_command(self, hwnd, msg, wparam, lparam):
+        self._dispatch(wparam & 0xFFFF)
+        return 0
+
+    def _dispatch(self, cmd_id):
+        for item in self._MENU_ITEMS:
+            if item and item[0] == cmd_id - self._CMD_BASE and item[2]:
+                try:
+                    getattr(self, item[2])()
+                except Exception as e:
+                    print(f'[Clipy] tray action error: {e}')
+                return
+
+    def _on_destroy(self, hwnd, msg, wparam, lparam):
+        import win32gui
+        try:
+            win32gui.Shell_NotifyIcon(win32gui.NIM_DELETE, (hwnd, 0))
+        except Exception:
+            pass
+        if self._menu is not None:
+            try:
+                win32gui.DestroyMenu(self._menu)
+            except Exception:
+                pass
+            self._menu = None
+        self._hwnd = None
+        win32gui.PostQuitMessage(0)
+        return 0
+
+    # ── pystray fallback ──────────────────────────────────────────────────
+
+    def _run_pystray(self):
+        # 32 px is what Shell_NotifyIcon actually displays at standard
+        # DPI — rendering at 64 px only paid for a downsample
+        img = _load_icon(32)
+        # Materialize the same _MENU_ITEMS table the native path uses,
+        # splicing in the bound methods
+        items = []
+        for item in self._MENU_ITEMS:
+            if item is None:
+                items.append(pystray.Menu.SEPARATOR)
+                continue
+            cmd, label, handler = item
+            if handler is None:
+                items.append(pystray.MenuItem(label, None, enabled=False))
+            else:
+                items.append(pystray.MenuItem(
+                    label, getattr(self, handler),
+                    default=(cmd == self._DEFAULT_CMD),
+                ))
+        self._icon = pystray.Icon('Clipy', img, 'Clipy for Windows',
+                                  menu=pystray.Menu(*items))
+        self._icon.run()
+
     def _show_popup(self, *_):
         self.app.show_popup()
 
@@ -80,3 +292,12 @@ class TrayIcon:
 
     def _quit(self, *_):
         self.app.quit()
+
+
+# Touch Pillow's lazy C extension at import so the DLL load and first
+# allocation happen during startup, not on the first tray render.
+if not os.environ.get('CLIPY_LAZY_INIT'):
+    try:
+        ImageDraw.Draw(Image.new('RGBA', (1, 1)))
+    except Exception:
+        pass